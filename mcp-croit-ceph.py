@@ -18,11 +18,10 @@ For more options, run:
 """
 
 import sys
-import asyncio
 
-# Import the main server class from src
-from src.core.mcp_server import main
+# Import the main server entry point from src
+from src.core.mcp_server import run_main
 
 if __name__ == "__main__":
-    # Run the server
-    asyncio.run(main())
+    # Run the server (on uvloop when available)
+    run_main()
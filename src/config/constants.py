@@ -39,6 +39,12 @@ MAX_CACHE_SIZE = 100
 # Log search cache TTL (seconds)
 LOG_SEARCH_CACHE_TTL_SECONDS = 300  # 5 minutes
 
+# Maximum number of cached log search results
+LOG_SEARCH_CACHE_MAX_ENTRIES = 256
+
+# Number of distinct search intents whose parse result is cached
+INTENT_PARSE_CACHE_SIZE = 512
+
 
 # =============================================================================
 # Token Optimization
@@ -83,12 +89,26 @@ DEFAULT_HTTPS_PORT = 443
 # WebSocket connection timeout (seconds)
 WEBSOCKET_TIMEOUT_SECONDS = 30
 
+# Overall timeout of direct Croit WebSocket log queries (seconds),
+# longer to allow for query param authentication
+CROIT_WEBSOCKET_TIMEOUT_SECONDS = 45
+
 # WebSocket message wait timeout (seconds)
 WEBSOCKET_MESSAGE_TIMEOUT_SECONDS = 5
 
 # Default API request timeout (seconds)
 API_REQUEST_TIMEOUT_SECONDS = 30
 
+# Connection pool of the shared API session
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 64
+
+# How long idle keep-alive connections are kept open (seconds)
+HTTP_KEEPALIVE_TIMEOUT_SECONDS = 75
+
+# DNS cache TTL of the shared API session (seconds)
+DNS_CACHE_TTL_SECONDS = 300
+
 
 # =============================================================================
 # Pagination & Limits
@@ -144,6 +164,12 @@ LOG_MEDIUM_SAMPLE_SIZE = 2000
 # Server discovery lookback hours
 SERVER_DISCOVERY_HOURS = 24
 
+# Chunk size when downloading log export ZIP files (bytes)
+LOG_EXPORT_CHUNK_SIZE = 64 * 1024  # 64 KiB
+
+# Downloaded log export ZIP files larger than this are spooled to disk (bytes)
+LOG_EXPORT_SPOOL_MAX_MEMORY = 16 * 1024 * 1024  # 16 MiB
+
 
 # =============================================================================
 # Response Compression
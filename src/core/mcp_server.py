@@ -10,9 +10,13 @@ import asyncio
 import json
 import logging
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Set
 
 # Third-party imports
 import aiohttp
@@ -28,6 +32,10 @@ from src.config.constants import (
     MAX_SCHEMA_PROPERTY_DEPTH,
     MAX_CATEGORY_TOOLS,
     MAX_ENDPOINTS_IN_RESPONSE,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_CONNECTION_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    DNS_CACHE_TTL_SECONDS,
 )
 from src.utils.helpers import parse_host_url, calculate_time_range, build_api_url
 
@@ -41,6 +49,7 @@ try:
     from src.logs.croit_log_tools import (
         handle_log_search,
         handle_log_check,
+        close_export_session,
         LOG_SEARCH_TOOLS,
     )
 
@@ -89,7 +98,116 @@ except ImportError:
             return data
 
 
+# orjson is used for the hot JSON paths (spec loading, request bodies), the
+# stdlib json module is used when it is not installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Both accept bytes and raise json.JSONDecodeError (orjson's error subclasses it)
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# uvloop gives a faster event loop for the stdio and aiohttp traffic, the
+# default asyncio loop is used where it is not available (e.g. Windows)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# HTTP methods exposed as API operations (swagger path items also hold e.g. "parameters")
+_HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+# Category <-> category tool name mapping, e.g. rbd-mirror <-> manage_rbd_mirror
+_CATEGORY_TOOL_PREFIX = "manage_"
+_CATEGORY_TO_TOOL_NAME = str.maketrans("-", "_")
+_TOOL_NAME_TO_CATEGORY = str.maketrans("_", "-")
+
+# Per-request headers for a pre-serialized JSON body; Authorization and
+# Accept are defaults of the shared API session
+_JSON_BODY_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# HTTP methods that send a JSON request body
+_BODY_METHODS = frozenset({"post", "put", "patch", "delete"})
+
+# Path template parameters, e.g. {pool} in /pools/{pool}/rbds
+_PATH_PARAM_RE = re.compile(r"\{([^}]+)\}")
+
+
+@lru_cache(maxsize=None)
+def _path_template_regex(template_path: str) -> re.Pattern:
+    """Compile a path template into a regex matching actual paths (cached per template)."""
+    # Replace {param} with regex that matches path segments
+    pattern = re.escape(template_path)
+    pattern = re.sub(r"\\\{[^}]+\\\}", r"[^/]+", pattern)
+    return re.compile(f"^{pattern}$")
+
+
+# Default pagination for endpoints that require it, per category (None is the
+# generic default). Read-only and shared; it is only ever sent as a JSON query
+# value, so the encoded strings are built once at import.
+DEFAULT_PAGINATION = MappingProxyType(
+    {
+        "rbds": {
+            "limit": 20,
+            "after": 0,
+            "where": {},
+            "sortBy": [["pool", "ASC"], ["namespace", "ASC"], ["name", "ASC"]],
+        },
+        None: {"limit": 20, "after": 0, "where": {}, "sortBy": []},
+    }
+)
+_DEFAULT_PAGINATION_JSON = MappingProxyType(
+    {
+        category: json.dumps(pagination, separators=(",", ":"))
+        for category, pagination in DEFAULT_PAGINATION.items()
+    }
+)
+
+
 class CroitCephServer:
+    # Fixed attribute layout: no per-instance __dict__, and attributes read on
+    # every tool call (host, session, api_spec, ...) are direct slot lookups
+    __slots__ = (
+        "mcp_tools",
+        "api_spec",
+        "host",
+        "api_base_url",
+        "api_token",
+        "ssl",
+        "resolved_references",
+        "category_endpoints",
+        "category_action_endpoints",
+        "top_categories",
+        "session",
+        "server",
+        "instructions",
+        "mode",
+        "max_category_tools",
+        "min_endpoints_per_category",
+        "openapi_file",
+        "use_included_api_spec",
+        "packaged_spec_path",
+        "offer_whole_spec",
+        "enable_log_tools",
+        "enable_daos",
+        "enable_specialty_features",
+        "check_permissions",
+        "hints_shown",
+        "list_endpoints_tool",
+        "call_endpoint_tool",
+        "get_schema_tool",
+        "get_apis_tool",
+        "call_api_tool",
+        "resolve_references_tool",
+        "_reference_cache",
+        "_response_fields_cache",
+        "_pagination_paths",
+    )
+
     def __init__(
         self,
         mode="hybrid",  # Supported modes: "hybrid", "base_only", "categories_only"
@@ -109,12 +227,23 @@ class CroitCephServer:
         self.api_spec = None
         # host is the cluster URL, e.g. http://172.31.134.4:8080
         self.host = None
+        # api_base_url is the API root derived from host, e.g. http://172.31.134.4:8080/api
+        self.api_base_url = None
         # resolved_references will be set to true when resolve_references is True
         self.resolved_references = False
         # Category mapping for hybrid and categories_only modes
         self.category_endpoints = {}
-        # session is used to make the actual API calls to the cluster
-        self.session = aiohttp.ClientSession()
+        # First endpoint per category tool action, e.g. {"pools": {"list": {...}}}
+        self.category_action_endpoints = {}
+        # Resolved $ref targets by reference path, filled by _resolve_reference_schema
+        self._reference_cache: Dict[str, Dict] = {}
+        # _extract_response_fields() results of GET operations by spec path
+        self._response_fields_cache: Dict[str, Dict[str, Any]] = {}
+        # Spec paths whose GET requires a pagination parameter, built on first use
+        self._pagination_paths: Optional[Set[str]] = None
+        # session is used to make the actual API calls to the cluster,
+        # created on first use by _get_session()
+        self.session: Optional[aiohttp.ClientSession] = None
         # Enable log search tools
         self.enable_log_tools = enable_log_tools and LOG_TOOLS_AVAILABLE
         # Feature flags
@@ -248,43 +377,58 @@ Many endpoints offer pagination. When available, use it to refine the query."""
 
         # Ensure host doesn't have trailing slash
         self.host = self.host.rstrip("/")
+        self.api_base_url = f"{self.host}/api"
         self.ssl = self.host.startswith("https")
 
     def _load_local_swagger_spec(self) -> None:
         """Load OpenAPI spec from a local file."""
         logger.info(f"Loading OpenAPI spec from local file: {self.openapi_file}")
         try:
-            with open(self.openapi_file, "r") as f:
-                self.api_spec = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(self.openapi_file, "rb") as f:
+                    self.api_spec = orjson.loads(f.read())
+            else:
+                with open(self.openapi_file, "r") as f:
+                    self.api_spec = json.load(f)
             logger.info(f"Successfully loaded OpenAPI spec from {self.openapi_file}")
         except FileNotFoundError:
             logger.error(f"OpenAPI spec file not found: {self.openapi_file}")
             raise
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # also raised by orjson
             logger.error(f"Invalid JSON in OpenAPI spec file: {e}")
             raise
 
     def _fetch_swagger_spec(self):
         """Fetch swagger.json from the croit cluster and store it in self.api_spec."""
-        swagger_url = f"{self.host}/api/swagger.json"
+        swagger_url = f"{self.api_base_url}/swagger.json"
         headers = {
             "Authorization": f"Bearer {self.api_token}",
             "Accept": "application/json",
         }
 
         logger.info(f"Fetching swagger spec from {swagger_url}")
-        resp = requests.get(swagger_url, headers=headers, verify=self.ssl)
-        if resp.status_code == 200:
-            self.api_spec = resp.json()
-        else:
-            logger.error(f"Failed to fetch swagger spec: {resp.status} - {resp.text()}")
+        with requests.get(swagger_url, headers=headers, verify=self.ssl) as resp:
+            if resp.status_code != 200:
+                logger.error(
+                    f"Failed to fetch swagger spec: {resp.status_code} - {resp.text}"
+                )
+                return
+            if ORJSON_AVAILABLE:
+                self.api_spec = orjson.loads(resp.content)
+            else:
+                self.api_spec = resp.json()
 
     def _resolve_reference_schema(self, ref_path: str) -> Dict:
         """
         Resolve a $ref reference in the swagger specification.
         E.g. if ref_path is #/components/schemas/ManagedTask, this will return the ManagedTask schema
         as defined in self.api_spec.
+        Shared definitions are referenced many times, so each target is looked up only once.
         """
+        cached = self._reference_cache.get(ref_path)
+        if cached is not None:
+            return cached
+
         logger.debug(f"Resolving {ref_path}")
         path = ref_path
         if path.startswith("#"):
@@ -295,6 +439,7 @@ Many endpoints offer pagination. When available, use it to refine the query."""
             if not isinstance(current, dict) or key not in current:
                 raise KeyError(f"Reference {ref_path} not found in specification")
             current = current[key]
+        self._reference_cache[ref_path] = current
         return current
 
     def _extract_response_fields(self, endpoint: Dict) -> Dict[str, Any]:
@@ -421,9 +566,13 @@ Valid filter ops are:
         def resolve_references(
             obj,
             root_spec,
-            resolved: Dict[str, bool],
+            resolved: Set[str],
         ) -> Optional[Dict]:
-            """Helper function for recursion"""
+            """
+            Helper function for recursion.
+            resolved holds the references on the current descent path only: a
+            reference is added when entering it and discarded again on exit.
+            """
             if isinstance(obj, dict):
                 # Check if this dict is a reference
                 if "$ref" in obj and len(obj) == 1:
@@ -436,26 +585,27 @@ Valid filter ops are:
                         # We already handle that case though.
                         logger.info(f"Recursion for reference {ref_path}, skipping it")
                         return None
-                    resolved[ref_path] = True
-                    resolved_path = self._resolve_reference_schema(ref_path=ref_path)
-                    # Recursively resolve the resolved content too
-                    return resolve_references(
-                        resolved_path, root_spec, resolved=resolved.copy()
-                    )
+                    resolved.add(ref_path)
+                    try:
+                        resolved_path = self._resolve_reference_schema(
+                            ref_path=ref_path
+                        )
+                        # Recursively resolve the resolved content too
+                        return resolve_references(resolved_path, root_spec, resolved)
+                    finally:
+                        resolved.discard(ref_path)
                 else:
                     # Regular dict - resolve all values
                     resolved_paths = {}
                     for key, value in obj.items():
-                        resolved_ref = resolve_references(
-                            value, root_spec, resolved=resolved.copy()
-                        )
+                        resolved_ref = resolve_references(value, root_spec, resolved)
                         if resolved_ref is not None:
                             resolved_paths[key] = resolved_ref
                     return resolved_paths
             elif isinstance(obj, list):
                 # Resolve all items in the list
                 return [
-                    resolve_references(item, root_spec, resolved=resolved.copy())
+                    resolve_references(item, root_spec, resolved)
                     for item in obj
                     if item is not None
                 ]
@@ -464,7 +614,7 @@ Valid filter ops are:
                 return obj
 
         self.api_spec["paths"] = resolve_references(
-            self.api_spec.get("paths", {}), self.api_spec, resolved={}
+            self.api_spec.get("paths", {}), self.api_spec, resolved=set()
         )
         self.resolved_references = True
 
@@ -477,10 +627,13 @@ Valid filter ops are:
         # https://spec.openapis.org/oas/v3.1.0.html#schema-object
         # The Schema Object format from OpenAPI is a superset JSON schema.
         # It doesn't add a lot, so we just use it directly and hope it works.
-        schema = openapi_schema.get("schema", {}).copy()
+        schema = openapi_schema.get("schema", {})
         # The description tends to be outside of the OpenAPI schema in a description field.
+        # The schema is only read from here on, so copy it only if the description changes.
         if schema.get("description", "") == "":
-            schema["description"] = openapi_schema.get("description", "")
+            description = openapi_schema.get("description", "")
+            if description or "description" not in schema:
+                schema = {**schema, "description": description}
 
         # Recursively resolve $ref references and add examples
         schema = self._resolve_refs_in_schema(schema)
@@ -569,7 +722,10 @@ Valid filter ops are:
         paths = self.api_spec.get("paths", {})
         for path, methods in paths.items():
             for method, operation in methods.items():
-                if method.lower() not in ["get", "post", "put", "delete", "patch"]:
+                # Swagger methods are lowercase already, only fold when they are not
+                if not method.islower():
+                    method = method.lower()
+                if method not in _HTTP_METHODS:
                     continue
 
                 if operation.get("deprecated", False):
@@ -583,7 +739,7 @@ Valid filter ops are:
 
                     endpoint_info = {
                         "path": path,
-                        "method": method.lower(),
+                        "method": method,
                         "operationId": operation.get("operationId", ""),
                         "summary": operation.get("summary", ""),
                         "description": operation.get("description", ""),
@@ -591,6 +747,13 @@ Valid filter ops are:
                     }
                     self.category_endpoints[tag].append(endpoint_info)
 
+        # Resolve which endpoint serves each category tool action once, instead
+        # of scanning the category's endpoints on every tool call
+        self.category_action_endpoints = {
+            category: self._index_category_actions(endpoints)
+            for category, endpoints in self.category_endpoints.items()
+        }
+
         # Filter categories based on feature flags
         filtered_tag_counter = {}
         for tag, count in tag_counter.items():
@@ -627,6 +790,41 @@ Valid filter ops are:
             f"Found {len(tag_counter)} categories, selected {len(self.top_categories)} accessible: {self.top_categories}"
         )
 
+    @staticmethod
+    def _index_category_actions(endpoints: List[Dict]) -> Dict[str, Dict]:
+        """
+        Map category tool actions (list/get/create/update/delete) to the first
+        endpoint of the category that serves them.
+        """
+        action_endpoints = {}
+        for ep in endpoints:
+            path = ep["path"]
+            method = ep["method"]
+            has_param = "{" in path
+
+            # Match endpoint pattern to action
+            if method == "get" and not has_param:
+                action = "list"
+            elif method == "get":
+                # Ensure it's a simple resource endpoint, not a status/action endpoint
+                if path.count("{") != 1 or any(
+                    word in path.lower()
+                    for word in ["status", "history", "action", "config"]
+                ):
+                    continue
+                action = "get"
+            elif method == "post" and not has_param:
+                action = "create"
+            elif method in ["put", "patch"] and has_param:
+                action = "update"
+            elif method == "delete" and has_param:
+                action = "delete"
+            else:
+                continue
+
+            action_endpoints.setdefault(action, ep)
+        return action_endpoints
+
     def _get_user_roles(self) -> List[str]:
         """
         Get user roles from /auth/token-info endpoint.
@@ -635,7 +833,7 @@ Valid filter ops are:
         import requests
 
         try:
-            token_info_url = f"{self.host}/api/auth/token-info"
+            token_info_url = f"{self.api_base_url}/auth/token-info"
             headers = {
                 "Authorization": f"Bearer {self.api_token}",
                 "Accept": "application/json",
@@ -1132,10 +1330,11 @@ Example filters:
         if has_delete:
             actions.append("delete")
 
-        tool_name = f"manage_{category.replace('-', '_')}"
-        description = (
+        tool_name = _CATEGORY_TOOL_PREFIX + category.translate(_CATEGORY_TO_TOOL_NAME)
+        # Description sections are collected and joined once at the end
+        description_parts = [
             f"Manage {category} resources. Available actions: {', '.join(actions)}"
-        )
+        ]
 
         # Extract ALL LLM hints for comprehensive tool description
         hint_purposes = []
@@ -1242,26 +1441,30 @@ Example filters:
 
         # Build enhanced description with ALL hints (clean, professional format)
         if hint_purposes:
-            description += f"\n\nPurpose: {hint_purposes[0][:200]}"
+            description_parts.append(f"\n\nPurpose: {hint_purposes[0][:200]}")
 
         if hint_usages:
-            description += f"\n\nCommon usage:\n• " + "\n• ".join(hint_usages[:3])
+            description_parts.append(
+                f"\n\nCommon usage:\n• " + "\n• ".join(hint_usages[:3])
+            )
 
         # Add workflow guidance if available
         if hint_workflow_guidance:
             if hint_workflow_guidance.get("pre_check"):
-                description += (
+                description_parts.append(
                     f"\n\nPre-check: {hint_workflow_guidance['pre_check'][:150]}"
                 )
             if hint_workflow_guidance.get("post_action"):
-                description += (
+                description_parts.append(
                     f"\n\nPost-action: {hint_workflow_guidance['post_action'][:150]}"
                 )
 
         # Add failure modes
         if hint_failure_modes:
-            unique_failures = list(set(hint_failure_modes))[:2]
-            description += f"\n\nFailure modes:\n• " + "\n• ".join(unique_failures)
+            unique_failures = list(islice(set(hint_failure_modes), 2))
+            description_parts.append(
+                f"\n\nFailure modes:\n• " + "\n• ".join(unique_failures)
+            )
 
         # Add error handling
         if hint_error_handling:
@@ -1272,32 +1475,40 @@ Example filters:
                     action = error.get("action", "No action specified")[:100]
                     error_info.append(f"{code}: {action}")
             if error_info:
-                description += f"\n\nError handling:\n• " + "\n• ".join(error_info)
+                description_parts.append(
+                    f"\n\nError handling:\n• " + "\n• ".join(error_info)
+                )
 
         # Add rate limits
         if hint_rate_limits:
-            unique_limits = list(set(hint_rate_limits))[:2]
-            description += f"\n\nRate limits: {', '.join(unique_limits)}"
+            unique_limits = list(islice(set(hint_rate_limits), 2))
+            description_parts.append(f"\n\nRate limits: {', '.join(unique_limits)}")
 
         # Add retry strategy
         if hint_retry_strategies:
             unique_strategies = list(set(hint_retry_strategies))
-            description += f"\n\nRetry strategy: {', '.join(unique_strategies)}"
+            description_parts.append(
+                f"\n\nRetry strategy: {', '.join(unique_strategies)}"
+            )
 
         # Add recommended polling intervals
         if hint_poll_intervals:
             unique_intervals = list(set(hint_poll_intervals))
-            description += f"\n\nPoll interval: {', '.join(unique_intervals)}"
+            description_parts.append(
+                f"\n\nPoll interval: {', '.join(unique_intervals)}"
+            )
 
         # Add cache hints
         if hint_cache_hints:
             unique_cache = list(set(hint_cache_hints))
-            description += f"\n\nCache: {', '.join(unique_cache)}"
+            description_parts.append(f"\n\nCache: {', '.join(unique_cache)}")
 
         # Add related endpoints
         if hint_related_endpoints:
-            unique_related = list(set(hint_related_endpoints))[:3]
-            description += f"\n\nRelated endpoints: {', '.join(unique_related)}"
+            unique_related = list(islice(set(hint_related_endpoints), 3))
+            description_parts.append(
+                f"\n\nRelated endpoints: {', '.join(unique_related)}"
+            )
 
         # Add Ceph integration steps (NEW)
         if hint_ceph_integration:
@@ -1306,42 +1517,46 @@ Example filters:
                 steps_text = "\n\nCeph Integration (automatic steps):\n" + "\n".join(
                     f"• {step}" for step in steps[:5]
                 )
-                description += steps_text
+                description_parts.append(steps_text)
 
         # Add workflow dependencies (NEW)
         if hint_workflow_dependencies:
             if hint_workflow_dependencies.get("prerequisite"):
-                description += f"\n\nPrerequisite: {hint_workflow_dependencies['prerequisite'][:200]}"
+                description_parts.append(
+                    f"\n\nPrerequisite: {hint_workflow_dependencies['prerequisite'][:200]}"
+                )
             if hint_workflow_dependencies.get("order"):
-                description += (
+                description_parts.append(
                     f"\nWorkflow order: {hint_workflow_dependencies['order'][:150]}"
                 )
 
         if hint_params:
-            unique_params = list(set(hint_params))[:5]
-            description += f"\n\nKey parameters: {', '.join(unique_params)}"
+            unique_params = list(islice(set(hint_params), 5))
+            description_parts.append(f"\n\nKey parameters: {', '.join(unique_params)}")
 
-        # Add optional sections efficiently
-        optional_sections = []
+        # Add optional sections
         if hint_examples:
-            optional_sections.append(
+            description_parts.append(
                 "\n\nRequest examples available via list_endpoints"
             )
         if has_token_hints:
-            optional_sections.append(
+            description_parts.append(
                 "\n\nToken optimization: Use filters and pagination"
             )
         if has_confirmations:
-            optional_sections.append("\n\nNote: Some operations require confirmation")
-
-        description += "".join(optional_sections)
+            description_parts.append("\n\nNote: Some operations require confirmation")
 
         # Add endpoint examples
         example_ops = endpoints[:3]
         if example_ops:
             examples = [f"{ep['method'].upper()} {ep['path']}" for ep in example_ops]
             if examples:
-                description += f"\n\nEndpoints: {'; '.join(examples)}"
+                description_parts.append(f"\n\nEndpoints: {'; '.join(examples)}")
+
+        description = "".join(description_parts)
+        # Increased limit to include x-llm-hints; only slice when actually needed
+        if len(description) > 1500:
+            description = description[:1500]
 
         input_schema = {
             "type": "object",
@@ -1370,9 +1585,7 @@ Example filters:
         self.mcp_tools.append(
             types.Tool(
                 name=tool_name,
-                description=description[
-                    :1500
-                ],  # Increased limit to include x-llm-hints
+                description=description,
                 inputSchema=input_schema,
             )
         )
@@ -1539,14 +1752,15 @@ CURRENT TIME CONTEXT (for timestamp calculations):
 
     async def handle_list_tools(self) -> list[types.Tool]:
         """Return available tools."""
-        logger.info(f"Providing {len(self.mcp_tools)} tools")
+        logger.info("Providing %d tools", len(self.mcp_tools))
         return self.mcp_tools
 
     async def _make_api_call(
         self,
         url: str,
         method: str,
-        kwargs: Dict,
+        params: Dict = None,
+        json_body: Any = None,
         filters: Dict = None,
         requested_fields: List[str] = None,
     ) -> dict[str, Any]:
@@ -1557,16 +1771,20 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         Args:
             url: API endpoint URL
             method: HTTP method
-            kwargs: Request kwargs (headers, params, etc.)
+            params: Query parameters (None for no query string)
+            json_body: JSON request body (None for no body)
             filters: grep-like filters to apply
             requested_fields: List of fields to include in response (for token optimization)
         """
+        method_upper = method.upper()
+
         # Check cache first for GET requests
-        if TOKEN_OPTIMIZER_AVAILABLE and method.upper() == "GET":
-            params = kwargs.get("params", {})
-            cached_result = get_cached_response(url, method, params)
+        if TOKEN_OPTIMIZER_AVAILABLE and method_upper == "GET":
+            cached_result = get_cached_response(
+                url, method, params if params is not None else {}
+            )
             if cached_result:
-                logger.info(f"Cache hit for {method} {url}")
+                logger.info("Cache hit for %s %s", method, url)
                 return {
                     "code": 200,
                     "result": cached_result,
@@ -1575,72 +1793,88 @@ CURRENT TIME CONTEXT (for timestamp calculations):
 
         # Auto-add default limits for list operations to prevent token overflow
         if TokenOptimizer.should_optimize(url, method):
-            params = kwargs.get("params", {})
-            params = TokenOptimizer.add_default_limit(url, params)
+            params = TokenOptimizer.add_default_limit(
+                url, params if params is not None else {}
+            )
 
             # Apply smart pre-filtering
             if TOKEN_OPTIMIZER_AVAILABLE:
                 url, params = TokenOptimizer.apply_smart_prefilter(url, params)
 
-            kwargs["params"] = params
-
-        logger.info(f"Calling {method} {url}")
+        logger.info("Calling %s %s", method, url)
         if filters:
-            logger.info(f"With filters: {filters}")
+            logger.info("With filters: %s", filters)
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"kwargs: {json.dumps(kwargs, indent=2)}")
+            request_args = {"params": params, "json": json_body}
+            logger.debug("Request: %s", json.dumps(request_args, indent=2))
+
+        # Serialize the body ourselves, aiohttp would run it through json.dumps
+        # and encode it again. Payloads orjson rejects go the stdlib way.
+        # Either way the body is sent as application/json (aiohttp's json= sets
+        # the Content-Type itself), all other headers are session defaults.
+        data = None
+        headers = None
+        if json_body is not None and ORJSON_AVAILABLE:
+            try:
+                data = orjson.dumps(json_body)
+                json_body = None
+                headers = _JSON_BODY_HEADERS
+            except TypeError:
+                pass
         try:
-            async with self.session.request(method.upper(), url, **kwargs) as resp:
-                response_text = await resp.text()
+            async with self._get_session().request(
+                method_upper,
+                url,
+                headers=headers,
+                params=params,
+                json=json_body,
+                data=data,
+            ) as resp:
+                # Parse the raw bytes directly instead of decoding to str first
+                response_body = await resp.read()
+
+                # This matches our schema defined in self._build_response_schema
+                schema_response = {
+                    "code": resp.status,
+                }
+
+                if not 200 <= resp.status < 300:
+                    # Error bodies only end up in the error message, so pass the
+                    # text through instead of parsing it into objects first
+                    error_text = response_body.decode("utf-8", errors="replace")
+                    schema_response["error"] = (
+                        f"{resp.reason}: {error_text}" if error_text else resp.reason
+                    )
+                    return schema_response
+
                 try:
-                    response_data = json.loads(response_text) if response_text else None
+                    response_data = (
+                        _json_loads(response_body) if response_body else None
+                    )
                 except json.JSONDecodeError as e:
                     # Response is not JSON (e.g., plain text error message)
-                    logger.debug(f"Non-JSON response from {url}: {e}")
-                    response_data = response_text
+                    logger.debug("Non-JSON response from %s: %s", url, e)
+                    response_data = response_body.decode("utf-8", errors="replace")
 
                 # Apply filters first (before truncation)
-                if resp.status >= 200 and resp.status < 300 and filters:
+                if filters:
                     response_data = TokenOptimizer.apply_filters(response_data, filters)
 
                 # Apply token optimization to response
-                if (
-                    resp.status >= 200
-                    and resp.status < 300
-                    and TOKEN_OPTIMIZER_AVAILABLE
-                ):
+                if TOKEN_OPTIMIZER_AVAILABLE:
                     response_data = optimize_api_response(
                         url=url,
                         method=method,
                         response_data=response_data,
-                        params=kwargs.get("params"),
+                        params=params,
                         requested_fields=requested_fields,
                     )
 
                 # Cache successful GET responses
-                if (
-                    resp.status >= 200
-                    and resp.status < 300
-                    and TOKEN_OPTIMIZER_AVAILABLE
-                    and method.upper() == "GET"
-                ):
-                    cache_response(url, method, response_data, kwargs.get("params"))
-
-                # This matches our schema defined in self._build_response_schema
-                schema_response = {
-                    "code": resp.status,
-                }
-
-                # Add result or error based on status
-                if resp.status >= 200 and resp.status < 300:
-                    schema_response["result"] = response_data
-                else:
-                    schema_response["error"] = (
-                        f"{resp.reason}: {response_data}"
-                        if response_data
-                        else resp.reason
-                    )
+                if TOKEN_OPTIMIZER_AVAILABLE and method_upper == "GET":
+                    cache_response(url, method, response_data, params)
 
+                schema_response["result"] = response_data
                 return schema_response
         except aiohttp.ClientError as e:
             # Network/connection errors (DNS, connection refused, etc.)
@@ -1704,14 +1938,9 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         endpoint = arguments["endpoint"]
         if not endpoint.startswith("/"):
             endpoint = "/" + endpoint
-        url = build_api_url(f"{self.host}/api", endpoint)
+        url = build_api_url(self.api_base_url, endpoint)
         method = arguments["method"]
 
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
         body = None
         if "body" in arguments:
             body = arguments["body"]
@@ -1725,35 +1954,64 @@ CURRENT TIME CONTEXT (for timestamp calculations):
                     value = json.dumps(value)
                 query_params[param["name"]] = value
 
-        kwargs = {"headers": headers, "ssl": self.ssl}
-        if query_params is not None:
-            kwargs["params"] = query_params
-        if body is not None:
-            kwargs["json"] = body
-
         # Extract requested fields for field projection
         requested_fields = arguments.get("fields")
 
         return await self._make_api_call(
-            url=url, method=method, kwargs=kwargs, requested_fields=requested_fields
+            url=url,
+            method=method,
+            params=query_params,
+            json_body=body,
+            requested_fields=requested_fields,
         )
 
-    async def run(self) -> None:
-        """Run the MCP server."""
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="mcp-croit-ceph",
-                    server_version="0.5.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={},
-                    ),
-                    instructions=self.instructions,
-                ),
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared API session, creating it on first use.
+        All API calls go through one connection pool with keep-alive, and the
+        authentication headers are set once as session defaults.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+                ssl=self.ssl,
             )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Authorization": f"Bearer {self.api_token}",
+                    "Accept": "application/json",
+                },
+            )
+        return self.session
+
+    async def run(self) -> None:
+        """Run the MCP server. The HTTP sessions are closed when the server stops."""
+        async with self._get_session():
+            try:
+                async with mcp.server.stdio.stdio_server() as (
+                    read_stream,
+                    write_stream,
+                ):
+                    await self.server.run(
+                        read_stream,
+                        write_stream,
+                        InitializationOptions(
+                            server_name="mcp-croit-ceph",
+                            server_version="0.5.0",
+                            capabilities=self.server.get_capabilities(
+                                notification_options=NotificationOptions(),
+                                experimental_capabilities={},
+                            ),
+                            instructions=self.instructions,
+                        ),
+                    )
+            finally:
+                if LOG_TOOLS_AVAILABLE:
+                    await close_export_session()
 
     async def handle_hybrid_tool(
         self,
@@ -1763,7 +2021,7 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         """
         Handle hybrid mode tools: base tools and category tools.
         """
-        logger.info(f"Hybrid tool call: {name} with args {arguments}")
+        logger.info("Hybrid tool call: %s with args %s", name, arguments)
 
         # Handle log search tools
         if self.enable_log_tools:
@@ -1799,7 +2057,7 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         """
         Handle category-only mode tools.
         """
-        logger.info(f"Category tool call: {name} with args {arguments}")
+        logger.info("Category tool call: %s with args %s", name, arguments)
 
         # Handle log search tools
         if self.enable_log_tools:
@@ -1847,7 +2105,9 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         Maps the action to the appropriate endpoint and makes the API call.
         """
         # Extract category from tool name (manage_services -> services)
-        category = name.replace("manage_", "").replace("_", "-")
+        category = name.removeprefix(_CATEGORY_TOOL_PREFIX).translate(
+            _TOOL_NAME_TO_CATEGORY
+        )
 
         if category not in self.category_endpoints:
             return {"error": f"Category {category} not found"}
@@ -1858,44 +2118,10 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         data = arguments.get("data", {})
 
         # Find matching endpoint based on action
-        endpoints = self.category_endpoints[category]
-        target_endpoint = None
-
-        for ep in endpoints:
-            path = ep["path"]
-            method = ep["method"]
-
-            # Match action to endpoint pattern
-            if action == "list" and method == "get" and "{" not in path:
-                target_endpoint = ep
-                break
-            elif action == "get" and method == "get" and "{" in path and resource_id:
-                # Ensure it's a simple resource endpoint, not a status/action endpoint
-                if path.count("{") == 1 and not any(
-                    word in path.lower()
-                    for word in ["status", "history", "action", "config"]
-                ):
-                    target_endpoint = ep
-                    break
-            elif action == "create" and method == "post" and "{" not in path:
-                target_endpoint = ep
-                break
-            elif (
-                action == "update"
-                and method in ["put", "patch"]
-                and "{" in path
-                and resource_id
-            ):
-                target_endpoint = ep
-                break
-            elif (
-                action == "delete"
-                and method == "delete"
-                and "{" in path
-                and resource_id
-            ):
-                target_endpoint = ep
-                break
+        target_endpoint = self.category_action_endpoints.get(category, {}).get(action)
+        if action in ["get", "update", "delete"] and not resource_id:
+            # Resource endpoints can only be called with a resource id
+            target_endpoint = None
 
         if not target_endpoint:
             return {
@@ -1909,20 +2135,15 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         # Replace path parameters
         if resource_id and "{" in path:
             # Find parameter name (e.g., {id}, {name}, etc.)
-            import re
-
-            params = re.findall(r"\{([^}]+)\}", path)
-            if params:
-                path = path.replace(f"{{{params[0]}}}", str(resource_id))
+            param = _PATH_PARAM_RE.search(path)
+            if param:
+                path = path.replace(param.group(0), str(resource_id))
 
         # Make the API call
-        url = f"{self.host}/api{path}"
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Accept": "application/json",
-        }
+        url = f"{self.api_base_url}{path}"
 
-        kwargs = {"headers": headers, "ssl": self.ssl}
+        params = None
+        json_body = None
 
         if action == "list":
             # Prepare query parameters
@@ -1931,27 +2152,17 @@ CURRENT TIME CONTEXT (for timestamp calculations):
             # Add default pagination for endpoints that require it
             if "pagination" not in params:
                 # Check if this endpoint needs pagination based on OpenAPI spec
-                endpoint_def = None
-                for ep in self.category_endpoints.get(category, []):
-                    if ep["method"] == method and ep["path"] == path:
-                        endpoint_def = ep
-                        break
-
-                if endpoint_def and self._endpoint_requires_pagination(
-                    endpoint_def["path"]
-                ):
-                    default_pagination = self._get_default_pagination(category)
-                    params["pagination"] = json.dumps(
-                        default_pagination, separators=(",", ":")
-                    )
+                if self._endpoint_requires_pagination(path):
+                    params["pagination"] = self._get_default_pagination(category)
 
-            if params:
-                kwargs["params"] = params
+            if not params:
+                params = None
         elif action in ["create", "update"] and data:
-            headers["Content-Type"] = "application/json"
-            kwargs["json"] = data
+            json_body = data
 
-        result = await self._make_api_call(url=url, method=method, kwargs=kwargs)
+        result = await self._make_api_call(
+            url=url, method=method, params=params, json_body=json_body
+        )
 
         # Add context about the operation and LLM hints
         context = {
@@ -2011,18 +2222,21 @@ CURRENT TIME CONTEXT (for timestamp calculations):
 
         for path, methods in self.api_spec.get("paths", {}).items():
             for method, operation in methods.items():
-                if method.lower() not in ["get", "post", "put", "delete", "patch"]:
+                # Swagger methods are lowercase already, only fold when they are not
+                if not method.islower():
+                    method = method.lower()
+                if method not in _HTTP_METHODS:
                     continue
 
                 # Apply filters
-                if method_filter and method.lower() != method_filter.lower():
+                if method_filter and method != method_filter.lower():
                     continue
 
                 # Apply intent filter
                 allowed_methods = intent_methods.get(
                     intent_filter, intent_methods["all"]
                 )
-                if method.lower() not in allowed_methods:
+                if method not in allowed_methods:
                     continue
 
                 tags = operation.get("tags", [])
@@ -2094,8 +2308,12 @@ CURRENT TIME CONTEXT (for timestamp calculations):
                     endpoint_data["required_permissions"] = required_perms
 
                 # Add available response fields for token optimization
-                if method.lower() == "get":
-                    response_info = self._extract_response_fields(operation)
+                if method == "get":
+                    # The response schema never changes, only extract its fields once
+                    response_info = self._response_fields_cache.get(path)
+                    if response_info is None:
+                        response_info = self._extract_response_fields(operation)
+                        self._response_fields_cache[path] = response_info
                     if response_info["fields"]:
                         fields = response_info["fields"]
                         endpoint_data["available_fields"] = fields
@@ -2222,9 +2440,16 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         query_params = arguments.get("query_params", {})
         body = arguments.get("body")
 
-        # Replace path parameters
-        for key, value in path_params.items():
-            path = path.replace(f"{{{key}}}", str(value))
+        # Replace path parameters in one pass
+        if path_params:
+            path = _PATH_PARAM_RE.sub(
+                lambda m: (
+                    str(path_params[m.group(1)])
+                    if m.group(1) in path_params
+                    else m.group(0)
+                ),
+                path,
+            )
 
         # Add default pagination for endpoints that require it
         if method == "get" and query_params is not None:
@@ -2234,27 +2459,20 @@ CURRENT TIME CONTEXT (for timestamp calculations):
             ):
                 # Determine category from endpoint path for appropriate defaults
                 category = self._detect_category_from_path(path)
-                default_pagination = self._get_default_pagination(category)
-                query_params["pagination"] = json.dumps(
-                    default_pagination, separators=(",", ":")
-                )
-
-        url = f"{self.host}/api{path}"
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Accept": "application/json",
-        }
+                query_params["pagination"] = self._get_default_pagination(category)
 
-        kwargs = {"headers": headers, "ssl": self.ssl}
+        url = f"{self.api_base_url}{path}"
 
-        if query_params:
-            kwargs["params"] = query_params
+        json_body = None
+        if body and method in _BODY_METHODS:
+            json_body = body
 
-        if body and method in ["post", "put", "patch", "delete"]:
-            headers["Content-Type"] = "application/json"
-            kwargs["json"] = body
-
-        return await self._make_api_call(url=url, method=method, kwargs=kwargs)
+        return await self._make_api_call(
+            url=url,
+            method=method,
+            params=query_params or None,
+            json_body=json_body,
+        )
 
     def _quick_find_endpoints(self, arguments: Dict) -> dict[str, Any]:
         """
@@ -2296,7 +2514,10 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         results = []
         for path, methods in self.api_spec.get("paths", {}).items():
             for method, operation in methods.items():
-                if method.lower() not in ["get", "post", "put", "delete", "patch"]:
+                # Swagger methods are lowercase already, only fold when they are not
+                if not method.islower():
+                    method = method.lower()
+                if method not in _HTTP_METHODS:
                     continue
 
                 tags = operation.get("tags", [])
@@ -2310,16 +2531,15 @@ CURRENT TIME CONTEXT (for timestamp calculations):
 
                 # Filter by action type if specified
                 if action_type != "all":
-                    method_lower = method.lower()
                     if action_type == "list" and not (
-                        method_lower == "get" and "{" not in path
+                        method == "get" and "{" not in path
                     ):
                         continue
-                    elif action_type == "create" and method_lower != "post":
+                    elif action_type == "create" and method != "post":
                         continue
                     elif action_type == "status" and "status" not in path.lower():
                         continue
-                    elif action_type == "manage" and method_lower == "get":
+                    elif action_type == "manage" and method == "get":
                         continue
 
                 # Build endpoint data
@@ -2375,44 +2595,33 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         Check if an endpoint requires pagination parameter based on OpenAPI spec.
         Supports both exact paths and parameterized paths.
         """
-        # First try exact match
-        endpoint_spec = (
-            self.api_spec.get("paths", {}).get(endpoint_path, {}).get("get", {})
-        )
+        # Look up the parameters of each GET endpoint once, not on every call
+        if self._pagination_paths is None:
+            self._pagination_paths = {
+                spec_path
+                for spec_path, methods in self.api_spec.get("paths", {}).items()
+                if any(
+                    param.get("name") == "pagination" and param.get("required", False)
+                    for param in methods.get("get", {}).get("parameters", [])
+                )
+            }
 
-        if endpoint_spec:
-            parameters = endpoint_spec.get("parameters", [])
-            for param in parameters:
-                if param.get("name") == "pagination" and param.get("required", False):
-                    return True
+        # First try exact match
+        if endpoint_path in self._pagination_paths:
+            return True
 
         # If no exact match, try pattern matching for parameterized paths
-        for spec_path, methods in self.api_spec.get("paths", {}).items():
-            if self._path_matches_template(endpoint_path, spec_path):
-                get_spec = methods.get("get", {})
-                parameters = get_spec.get("parameters", [])
-                for param in parameters:
-                    if param.get("name") == "pagination" and param.get(
-                        "required", False
-                    ):
-                        return True
-
-        return False
+        return any(
+            self._path_matches_template(endpoint_path, spec_path)
+            for spec_path in self._pagination_paths
+        )
 
     def _path_matches_template(self, actual_path: str, template_path: str) -> bool:
         """
         Check if an actual path matches a template path with parameters.
         e.g., '/pools/test-pool/rbds' matches '/pools/{pool}/rbds'
         """
-        import re
-
-        # Convert template to regex pattern
-        # Replace {param} with regex that matches path segments
-        pattern = re.escape(template_path)
-        pattern = re.sub(r"\\\{[^}]+\\\}", r"[^/]+", pattern)
-        pattern = f"^{pattern}$"
-
-        return bool(re.match(pattern, actual_path))
+        return _path_template_regex(template_path).match(actual_path) is not None
 
     def _detect_category_from_path(self, path: str) -> str:
         """
@@ -2439,26 +2648,20 @@ CURRENT TIME CONTEXT (for timestamp calculations):
         # Default
         return "generic"
 
-    def _get_default_pagination(self, category: str) -> dict:
+    def _get_default_pagination(self, category: str) -> str:
         """
-        Get appropriate default pagination for a category.
+        Get appropriate default pagination for a category, JSON encoded for the
+        pagination query parameter.
         """
-        # Category-specific defaults
-        if category == "rbds":
-            return {
-                "limit": 20,
-                "after": 0,
-                "where": {},
-                "sortBy": [["pool", "ASC"], ["namespace", "ASC"], ["name", "ASC"]],
-            }
-
-        # Generic default
-        return {"limit": 20, "after": 0, "where": {}, "sortBy": []}
+        # Category-specific defaults, falling back to the generic default
+        return _DEFAULT_PAGINATION_JSON.get(category, _DEFAULT_PAGINATION_JSON[None])
 
     async def cleanup(self):
-        """Cleanup resources."""
+        """Cleanup resources when the server is used without run()."""
         if self.session:
             await self.session.close()
+        if LOG_TOOLS_AVAILABLE:
+            await close_export_session()
 
 
 async def main():
@@ -2528,11 +2731,17 @@ async def main():
     # Set permission check flag
     server.check_permissions = args.check_permissions
 
-    try:
-        await server.run()
-    finally:
-        await server.cleanup()
+    # run() closes the API session itself on shutdown
+    await server.run()
+
+
+def run_main():
+    """Run main() on uvloop when installed, otherwise on the default asyncio loop."""
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_main()
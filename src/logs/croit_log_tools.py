@@ -4,18 +4,21 @@ Croit Log Intelligence Tools for MCP Server
 Provides advanced log search and analysis capabilities
 """
 
+import copy
 import json
 import asyncio
+import heapq
 import websockets
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import BinaryIO, Dict, List, Any, Optional, Tuple
 import re
-import hashlib
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
 import aiohttp
 import zipfile
-import io
+import tempfile
 
 # Import utility functions
 from src.utils.helpers import calculate_time_range
@@ -26,10 +29,50 @@ from src.config.constants import (
     LOG_ANALYSIS_SAMPLE_SIZE,
     LOG_MEDIUM_SAMPLE_SIZE,
     DEFAULT_HTTP_PORT,
+    LOG_SEARCH_CACHE_TTL_SECONDS,
+    LOG_SEARCH_CACHE_MAX_ENTRIES,
+    WEBSOCKET_TIMEOUT_SECONDS,
+    CROIT_WEBSOCKET_TIMEOUT_SECONDS,
+    WEBSOCKET_MESSAGE_TIMEOUT_SECONDS,
+    INTENT_PARSE_CACHE_SIZE,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_CONNECTION_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    DNS_CACHE_TTL_SECONDS,
+    LOG_EXPORT_CHUNK_SIZE,
+    LOG_EXPORT_SPOOL_MAX_MEMORY,
 )
 
 logger = logging.getLogger(__name__)
 
+# orjson speeds up the per-message log parsing, the stdlib json module is used
+# when it is not installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Both raise json.JSONDecodeError (orjson's error subclasses it)
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a query to a compact JSON string, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Response headers worth showing in debug output
+_DEBUG_RESPONSE_HEADERS = ("Content-Type", "Content-Length", "Content-Encoding", "ETag")
+
+
+def _debug_response_headers(headers) -> Dict[str, str]:
+    """Pick the debug-relevant response headers instead of copying all of them"""
+    return {name: headers[name] for name in _DEBUG_RESPONSE_HEADERS if name in headers}
+
 
 class LogSearchIntentParser:
     """Parse natural language into structured search intents"""
@@ -75,24 +118,56 @@ class LogSearchIntentParser:
 
     def parse(self, search_intent: str) -> Dict[str, Any]:
         """Parse natural language search intent"""
+        intent, query_type, services, levels, keywords = self._classify(search_intent)
+
+        return {
+            "type": query_type,
+            "services": list(services),
+            "levels": list(levels),  # Empty list = no level filter = all logs
+            "keywords": list(keywords),
+            # Relative to now, so never part of the cached classification
+            "time_range": self._parse_time_range(intent),
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=INTENT_PARSE_CACHE_SIZE)
+    def _classify(search_intent: str) -> Tuple[str, str, tuple, tuple, tuple]:
+        """Time-independent part of parse(), cached per raw intent string
+
+        Returns the normalized intent text, the query type and tuples of
+        services, levels and keywords.
+        """
         intent = search_intent.lower()
 
         # Detect Ceph service references and translate them
-        ceph_services = CephServiceTranslator.detect_ceph_services_in_text(
-            search_intent
-        )
+        ceph_services = CephServiceTranslator.detect_ceph_services_in_text(intent)
         translated_services = []
+        replacements = {}
         for service in ceph_services:
             translated = CephServiceTranslator.translate_service_name(service)
             translated_services.append(translated)
-            # Replace in intent for better pattern detection
-            intent = intent.replace(service.lower(), translated.lower())
+            if translated != service:
+                replacements.setdefault(service, translated)
+
+        # Replace in intent for better pattern detection, all services in one
+        # pass (longest first so "mon.a" does not eat into "mon.a-b")
+        if replacements:
+            services_re = re.compile(
+                "|".join(
+                    re.escape(name)
+                    for name in sorted(replacements, key=len, reverse=True)
+                )
+            )
+            intent = services_re.sub(lambda m: replacements[m.group(0)], intent)
 
         # Detect patterns
-        detected_patterns = []
-        for pattern_name, pattern_def in self.PATTERNS.items():
-            if re.search(pattern_def["regex"], intent, re.IGNORECASE):
-                detected_patterns.append(pattern_name)
+        # Most intents mention none of the anchor words; skip the regex then
+        fired = set()
+        if any(anchor in intent for anchor in _PATTERN_ANCHORS):
+            fired = {m.lastgroup for m in _COMBINED_PATTERN_RE.finditer(intent)}
+        detected_patterns = [
+            name for name in LogSearchIntentParser.PATTERNS if name in fired
+        ]
 
         # Extract components
         services = set()
@@ -103,7 +178,7 @@ class LogSearchIntentParser:
         services.update(translated_services)
 
         for pattern_name in detected_patterns:
-            pattern = self.PATTERNS[pattern_name]
+            pattern = LogSearchIntentParser.PATTERNS[pattern_name]
             services.update(pattern["services"])
             levels.update(pattern["levels"])
             keywords.update(pattern["keywords"])
@@ -112,27 +187,24 @@ class LogSearchIntentParser:
         intent_lower = intent.lower()
 
         # Explicit level requests
-        if (
-            "all level" in intent_lower
-            or "all log" in intent_lower
-            or "everything" in intent_lower
-        ):
+        level_hits = set(_LEVEL_TRIGGER_RE.findall(intent_lower))
+        if level_hits & _ALL_LEVEL_TRIGGERS:
             levels = set()  # No level filter
-        elif "critical" in intent_lower or "emergency" in intent_lower:
+        elif level_hits & _CRITICAL_TRIGGERS:
             levels.update(["EMERGENCY", "ALERT", "CRITICAL"])
-        elif "error" in intent_lower and "no error" not in intent_lower:
+        elif "error" in level_hits and "no error" not in level_hits:
             levels.update(["ERROR", "CRITICAL", "ALERT", "EMERGENCY"])
-        elif "warning" in intent_lower or "warn" in intent_lower:
+        elif "warn" in level_hits:
             levels.update(["WARNING", "ERROR", "CRITICAL", "ALERT", "EMERGENCY"])
-        elif "info" in intent_lower and "info" not in " ".join(keywords).lower():
+        elif "info" in level_hits:
             levels.update(
                 ["INFO", "WARNING", "ERROR", "CRITICAL", "ALERT", "EMERGENCY"]
             )
-        elif "debug" in intent_lower:
+        elif "debug" in level_hits:
             levels.update(
                 ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "ALERT", "EMERGENCY"]
             )
-        elif "trace" in intent_lower:
+        elif "trace" in level_hits:
             levels = set()  # All levels for trace
 
         # Kernel-specific optimizations
@@ -185,114 +257,129 @@ class LogSearchIntentParser:
                     ["INFO", "NOTICE", "WARNING", "ERROR"]
                 )  # Include info for performance data
 
-        # Parse time range
-        time_range = self._parse_time_range(intent)
-
         # Determine query type
         query_type = "tail" if "monitor" in intent or "stream" in intent else "query"
 
-        return {
-            "type": query_type,
-            "services": list(services),
-            "levels": (
-                list(levels) if levels else []
-            ),  # Empty list = no level filter = all logs
-            "keywords": list(keywords),
-            "time_range": time_range,
-        }
+        return intent, query_type, tuple(services), tuple(levels), tuple(keywords)
 
     def _parse_time_range(self, text: str) -> Dict[str, str]:
         """Extract time range from text"""
         now = datetime.now()
         text_lower = text.lower()
 
-        # Pattern matching for time expressions
-        patterns = {
-            "last hour": timedelta(hours=1),
-            "past hour": timedelta(hours=1),
-            "last day": timedelta(days=1),
-            "past day": timedelta(days=1),
-            "last week": timedelta(days=7),
-            "recent": timedelta(minutes=15),
-        }
-
-        for pattern, delta in patterns.items():
-            if pattern in text_lower:
-                return {
-                    "start": (now - delta).isoformat() + "Z",
-                    "end": now.isoformat() + "Z",
-                }
-
-        # Check for "X ago" pattern (e.g., "one hour ago", "5 minutes ago")
-        match = re.search(
-            r"(\d+|one|two|three|four|five|six|seven|eight|nine|ten)\s+(second|minute|hour|day|week)s?\s+ago",
-            text_lower,
-        )
-        if match:
-            amount_str = match.group(1)
-            unit = match.group(2)
-
-            # Convert word numbers to digits
-            word_to_num = {
-                "one": 1,
-                "two": 2,
-                "three": 3,
-                "four": 4,
-                "five": 5,
-                "six": 6,
-                "seven": 7,
-                "eight": 8,
-                "nine": 9,
-                "ten": 10,
-            }
-            amount = word_to_num.get(
+        # One scan collects every time expression, then the same precedence
+        # as before applies: fixed phrases, then "X ago", then "last/past N"
+        phrases = set()
+        ago_match = relative_match = None
+        for match in _TIME_EXPRESSION_RE.finditer(text_lower):
+            if match.group("phrase"):
+                phrases.add(match.group("phrase"))
+            elif match.group("ago_amount"):
+                ago_match = ago_match or match
+            else:
+                relative_match = relative_match or match
+
+        delta = timedelta(hours=1)  # Default to last hour
+        if phrases:
+            delta = next(d for p, d in _TIME_PHRASES.items() if p in phrases)
+        elif ago_match:
+            # e.g. "one hour ago", "5 minutes ago"
+            amount_str = ago_match.group("ago_amount")
+            amount = _WORD_NUMBERS.get(
                 amount_str, int(amount_str) if amount_str.isdigit() else 1
             )
+            delta = timedelta(**{ago_match.group("ago_unit") + "s": amount})
+        elif relative_match:
+            # e.g. "last 30 minutes", "past 2 days"
+            amount = int(relative_match.group("relative_amount"))
+            delta = timedelta(**{relative_match.group("relative_unit") + "s": amount})
 
-            if "second" in unit:
-                delta = timedelta(seconds=amount)
-            elif "minute" in unit:
-                delta = timedelta(minutes=amount)
-            elif "hour" in unit:
-                delta = timedelta(hours=amount)
-            elif "day" in unit:
-                delta = timedelta(days=amount)
-            elif "week" in unit:
-                delta = timedelta(weeks=amount)
-            else:
-                delta = timedelta(hours=1)
+        return {
+            "start": (now - delta).isoformat() + "Z",
+            "end": now.isoformat() + "Z",
+        }
 
-            return {
-                "start": (now - delta).isoformat() + "Z",
-                "end": now.isoformat() + "Z",
-            }
 
-        # Check for relative time with "last/past"
-        match = re.search(r"(last|past)\s+(\d+)\s+(minute|hour|day|week)s?", text_lower)
-        if match:
-            amount = int(match.group(2))
-            unit = match.group(3)
-            if "minute" in unit:
-                delta = timedelta(minutes=amount)
-            elif "hour" in unit:
-                delta = timedelta(hours=amount)
-            elif "day" in unit:
-                delta = timedelta(days=amount)
-            elif "week" in unit:
-                delta = timedelta(weeks=amount)
-            else:
-                delta = timedelta(hours=1)
+# All intent patterns in one pass. Each alternative sits in a zero-width
+# lookahead so finditer tries every position and a long match of one pattern
+# (e.g. "osd ... timeout") does not hide another starting inside it.
+_COMBINED_PATTERN_RE = re.compile(
+    "|".join(
+        f"(?=(?P<{name}>{pattern_def['regex']}))"
+        for name, pattern_def in LogSearchIntentParser.PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+# Literals at least one of which every PATTERNS regex needs to match. The
+# intent is lowercased before matching, so plain substring checks suffice.
+_PATTERN_ANCHORS = (
+    "osd",
+    "object",
+    "slow",
+    "blocked",
+    "stuck",
+    "delayed",
+    "auth",
+    "login",
+    "permission",
+    "network",
+    "connection",
+    "timeout",
+    "unreachable",
+    "heartbeat",
+    "msgr",
+    "pool",
+)
+# Level keywords found in one scan. These are substring matches, like the
+# checks they replace, so "errors" and "warnings" still count; "no error" comes
+# before "error" so it wins at the same position.
+_LEVEL_TRIGGER_RE = re.compile(
+    r"all level|all log|everything|critical|emergency|no error|error|warn|info|debug|trace"
+)
+_ALL_LEVEL_TRIGGERS = frozenset({"all level", "all log", "everything"})
+_CRITICAL_TRIGGERS = frozenset({"critical", "emergency"})
+# Fixed time phrases, in order of precedence
+_TIME_PHRASES = {
+    "last hour": timedelta(hours=1),
+    "past hour": timedelta(hours=1),
+    "last day": timedelta(days=1),
+    "past day": timedelta(days=1),
+    "last week": timedelta(days=7),
+    "recent": timedelta(minutes=15),
+}
+_WORD_NUMBERS = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+}
+# Every kind of time expression in one regex. The lookahead makes finditer try
+# each position, so e.g. "last 10 minutes ago" still yields the "ago" match.
+_TIME_EXPRESSION_RE = re.compile(
+    "(?=(?P<phrase>"
+    + "|".join(map(re.escape, _TIME_PHRASES))
+    + r")|(?P<ago_amount>\d+|"
+    + "|".join(_WORD_NUMBERS)
+    + r")\s+(?P<ago_unit>second|minute|hour|day|week)s?\s+ago"
+    + r"|(?:last|past)\s+(?P<relative_amount>\d+)\s+(?P<relative_unit>minute|hour|day|week)s?)"
+)
 
-            return {
-                "start": (now - delta).isoformat() + "Z",
-                "end": now.isoformat() + "Z",
-            }
+# Levels counted as errors in pattern analysis
+_ERROR_LEVELS = frozenset({"ERROR", "FATAL"})
 
-        # Default to last hour
-        return {
-            "start": (now - timedelta(hours=1)).isoformat() + "Z",
-            "end": now.isoformat() + "Z",
-        }
+# Message normalization for error clustering: numbers become "N", hex ids of
+# 8+ digits "HEX". Decimal is tried first, as when these were two passes.
+_NUMBER_OR_HEX_RE = re.compile(r"\b(?:(\d+)|[0-9a-f]{8,})\b")
+
+
+def _normalize_token(match: re.Match) -> str:
+    return "N" if match.group(1) else "HEX"
 
 
 class LogsQLBuilder:
@@ -303,37 +390,53 @@ class LogsQLBuilder:
         conditions = []
 
         # Add time filter first for optimization
-        if intent.get("time_range"):
-            start = intent["time_range"].get("start")
-            end = intent["time_range"].get("end")
+        time_range = intent.get("time_range")
+        if time_range:
+            start = time_range.get("start")
+            end = time_range.get("end")
             if start and end:
                 conditions.append(f"_time:[{start}, {end}]")
 
+        # Service, severity and keyword filters don't depend on the time, so
+        # repeated searches reuse the cached clause
+        filters = self._filter_clause(
+            tuple(intent.get("services") or ()),
+            tuple(intent.get("levels") or ()),
+            tuple(intent.get("keywords") or ()),
+        )
+        if filters:
+            conditions.append(filters)
+
+        return " AND ".join(conditions)
+
+    @staticmethod
+    @lru_cache(maxsize=INTENT_PARSE_CACHE_SIZE)
+    def _filter_clause(
+        services: Tuple[str, ...], levels: Tuple[str, ...], keywords: Tuple[str, ...]
+    ) -> str:
+        """Build the non-time part of the query, cached per filter combination"""
+        conditions = []
+
         # Add service filters
-        if intent.get("services"):
-            service_conditions = [f"service:{s}" for s in intent["services"]]
-            if len(service_conditions) > 1:
-                conditions.append(f"({' OR '.join(service_conditions)})")
-            else:
-                conditions.append(service_conditions[0])
+        if services:
+            conditions.append(LogsQLBuilder._any_of("service:", services))
 
         # Add severity filters
-        if intent.get("levels"):
-            level_conditions = [f"level:{l}" for l in intent["levels"]]
-            if len(level_conditions) > 1:
-                conditions.append(f"({' OR '.join(level_conditions)})")
-            else:
-                conditions.append(level_conditions[0])
+        if levels:
+            conditions.append(LogsQLBuilder._any_of("level:", levels))
 
         # Add keyword search
-        if intent.get("keywords"):
-            keyword_conditions = [f'_msg:"{k}"' for k in intent["keywords"]]
-            if len(keyword_conditions) > 1:
-                conditions.append(f"({' OR '.join(keyword_conditions)})")
-            else:
-                conditions.append(keyword_conditions[0])
+        if keywords:
+            conditions.append(LogsQLBuilder._any_of('_msg:"', keywords, '"'))
+
+        return " AND ".join(conditions)
 
-        return " AND ".join(conditions) if conditions else ""
+    @staticmethod
+    def _any_of(prefix: str, values: Tuple[str, ...], suffix: str = "") -> str:
+        """OR together one condition per value, bare when there is only one"""
+        if len(values) == 1:
+            return f"{prefix}{values[0]}{suffix}"
+        return f"({' OR '.join([f'{prefix}{v}{suffix}' for v in values])})"
 
 
 class CroitLogSearchClient:
@@ -361,20 +464,52 @@ class CroitLogSearchClient:
         self.builder = LogsQLBuilder()
         self.server_detector = ServerIDDetector(self)
         self.transport_analyzer = LogTransportAnalyzer(self)
+        self._summary_engine = LogSummaryEngine()
+
+        # Cache for results, bounded LRU so one-off queries don't pile up
+        self.cache = OrderedDict()
+        self.cache_ttl = LOG_SEARCH_CACHE_TTL_SECONDS
+        self.cache_max_entries = LOG_SEARCH_CACHE_MAX_ENTRIES
+
+        # HTTP session, created on first use and shared by all HTTP queries
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use
 
-        # Cache for results
-        self.cache = {}
-        self.cache_ttl = 300  # 5 minutes
+        Keep-alive connections are pooled across searches, server detection
+        and transport analysis; auth headers are set once as session defaults.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+            )
+            headers = {"Content-Type": "application/json"}
+            if self.api_token:
+                headers["Authorization"] = f"Bearer {self.api_token}"
+            self._session = aiohttp.ClientSession(connector=connector, headers=headers)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def search_logs(self, search_query: str, limit: int = 1000) -> Dict[str, Any]:
         """Search logs using natural language query"""
 
         # Check cache
-        cache_key = hashlib.md5(f"{search_query}{limit}".encode()).hexdigest()
-        if cache_key in self.cache:
-            cached = self.cache[cache_key]
-            if (datetime.now() - cached["timestamp"]).seconds < self.cache_ttl:
+        cache_key = (search_query, limit)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            if time.monotonic() - cached["timestamp"] < self.cache_ttl:
+                self.cache.move_to_end(cache_key)
                 return cached["data"]
+            del self.cache[cache_key]
 
         # Parse intent
         intent = self.parser.parse(search_query)
@@ -395,7 +530,7 @@ class CroitLogSearchClient:
         # Execute query
         try:
             logs = await self._execute_websocket_query(request)
-            logger.debug(f"WebSocket query successful: {len(logs)} logs returned")
+            logger.debug("WebSocket query successful: %d logs returned", len(logs))
         except (
             websockets.exceptions.WebSocketException,
             ConnectionError,
@@ -407,36 +542,36 @@ class CroitLogSearchClient:
                 f"WebSocket failed ({type(e).__name__}), falling back to HTTP: {e}"
             )
             logs = await self._execute_http_query(request)
-            logger.debug(f"HTTP fallback completed: {len(logs)} logs returned")
+            logger.debug("HTTP fallback completed: %d logs returned", len(logs))
 
         # Analyze results with intelligent prioritization
-        patterns = self._analyze_patterns(logs) if logs else []
-        insights = self._generate_insights(logs, patterns)
+        patterns, level_counts = self._analyze_logs(logs)
+        insights = self._generate_insights(logs, patterns, level_counts)
 
         # Create log summary for better overview
-        summary_engine = LogSummaryEngine()
+        summary_engine = self._summary_engine
         log_summary = summary_engine.summarize_logs(logs, max_details=20)
 
         # Intelligent truncation: prioritize critical events
         if logs and len(logs) > 100:
-            # Get critical events with full log data
-            critical_events = log_summary["critical_events"]
-            critical_logs = [
-                event["log"] for event in critical_events[:50]
-            ]  # Top 50 critical
-
-            # Fill remaining space with recent logs (avoiding duplicates)
-            critical_log_ids = {id(log) for log in critical_logs}
-            recent_logs = [log for log in logs[-50:] if id(log) not in critical_log_ids]
-
-            intelligent_results = critical_logs + recent_logs
-            intelligent_results = intelligent_results[:100]  # Final limit
+            # Top 50 critical events with full log data, then fill up to 100
+            # with recent logs (avoiding duplicates), all in one list
+            critical_events = log_summary["critical_events"][:50]
+            intelligent_results = [event["log"] for event in critical_events]
+            critical_shown = len(intelligent_results)
+
+            critical_indices = {event["log_index"] for event in critical_events}
+            intelligent_results.extend(
+                logs[i]
+                for i in range(max(0, len(logs) - 50), len(logs))
+                if i not in critical_indices
+            )
 
             truncation_info = {
                 "total_logs": len(logs),
                 "shown_logs": len(intelligent_results),
-                "critical_events_shown": len(critical_logs),
-                "recent_logs_shown": len(recent_logs),
+                "critical_events_shown": critical_shown,
+                "recent_logs_shown": len(intelligent_results) - critical_shown,
                 "truncation_method": "intelligent_priority",
             }
         else:
@@ -459,7 +594,10 @@ class CroitLogSearchClient:
         }
 
         # Cache result
-        self.cache[cache_key] = {"timestamp": datetime.now(), "data": result}
+        self.cache[cache_key] = {"timestamp": time.monotonic(), "data": result}
+        self.cache.move_to_end(cache_key)
+        while len(self.cache) > self.cache_max_entries:
+            self.cache.popitem(last=False)
 
         return result
 
@@ -571,7 +709,7 @@ class CroitLogSearchClient:
         # Execute query
         try:
             logs = await self._execute_http_query(base_query)
-            logger.debug(f"Parameterized search completed: {len(logs)} logs returned")
+            logger.debug("Parameterized search completed: %d logs returned", len(logs))
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             # Network errors during HTTP query
             logger.error(f"Parameterized search failed ({type(e).__name__}): {e}")
@@ -585,19 +723,25 @@ class CroitLogSearchClient:
         actual_hours_searched = (end_time - start_time) / 3600.0
 
         # Create summary
-        summary_engine = LogSummaryEngine()
+        summary_engine = self._summary_engine
         log_summary = summary_engine.summarize_logs(logs, max_details=15)
 
         # Intelligent truncation
         if logs and len(logs) > limit // 2:  # Apply intelligent truncation
             critical_events = log_summary["critical_events"]
-            critical_logs = [event["log"] for event in critical_events[: limit // 3]]
-            recent_logs = logs[-(limit // 3) :] if len(logs) > limit // 3 else logs
+            critical_events = critical_events[: limit // 3]
+            critical_logs = [event["log"] for event in critical_events]
+            recent_count = limit // 3
+            recent_start = (
+                len(logs) - recent_count if 0 < recent_count < len(logs) else 0
+            )
 
             # Avoid duplicates
-            critical_log_ids = {id(log) for log in critical_logs}
+            critical_indices = {event["log_index"] for event in critical_events}
             recent_logs = [
-                log for log in recent_logs if id(log) not in critical_log_ids
+                logs[i]
+                for i in range(recent_start, len(logs))
+                if i not in critical_indices
             ]
 
             final_logs = critical_logs + recent_logs
@@ -689,10 +833,9 @@ class CroitLogSearchClient:
         # Truncate long messages
         if "results" in optimized:
             for log in optimized["results"]:
-                if "MESSAGE" in log and len(log["MESSAGE"]) > max_message_length:
-                    log["MESSAGE"] = (
-                        log["MESSAGE"][:max_message_length] + "...[truncated]"
-                    )
+                message = log.get("MESSAGE")
+                if message is not None and len(message) > max_message_length:
+                    log["MESSAGE"] = message[:max_message_length] + "...[truncated]"
                     log["_message_truncated"] = True
 
         # Optimize summary critical events
@@ -743,23 +886,36 @@ class CroitLogSearchClient:
                 ping_interval=20,
             ) as websocket:
                 # Send query
-                await websocket.send(json.dumps(request))
+                await websocket.send(_json_dumps(request))
 
-                # Collect responses
-                start = datetime.now()
-                while (datetime.now() - start).seconds < 30:
-                    try:
-                        response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                        if response:
-                            try:
-                                log_entry = json.loads(response)
-                                logs.append(log_entry)
-                            except json.JSONDecodeError:
-                                logger.warning(f"Non-JSON response: {response[:100]}")
-                    except asyncio.TimeoutError:
-                        break
-                    except websockets.exceptions.ConnectionClosed:
-                        break
+                # Collect responses until the stream goes idle, closes or
+                # hits the overall deadline; one timer is pushed forward per
+                # message instead of a wait_for() task per recv()
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + WEBSOCKET_TIMEOUT_SECONDS
+                try:
+                    async with asyncio.timeout_at(
+                        loop.time() + WEBSOCKET_MESSAGE_TIMEOUT_SECONDS
+                    ) as idle_timeout:
+                        async for response in websocket:
+                            if response:
+                                try:
+                                    log_entry = _json_loads(response)
+                                    logs.append(log_entry)
+                                except json.JSONDecodeError:
+                                    logger.warning(
+                                        f"Non-JSON response: {response[:100]}"
+                                    )
+                            idle_timeout.reschedule(
+                                min(
+                                    loop.time() + WEBSOCKET_MESSAGE_TIMEOUT_SECONDS,
+                                    deadline,
+                                )
+                            )
+                except TimeoutError:
+                    pass
+                except websockets.exceptions.ConnectionClosed:
+                    pass
 
         except websockets.exceptions.WebSocketException as e:
             # WebSocket protocol errors
@@ -776,124 +932,179 @@ class CroitLogSearchClient:
 
         return logs
 
-    async def _execute_http_query(self, request: Dict) -> List[Dict]:
-        """Fallback HTTP query execution"""
-        logs = []
+    async def _execute_http_query(
+        self, request: Dict, raise_on_error: bool = False
+    ) -> List[Dict]:
+        """Fallback HTTP query execution
 
-        headers = {"Content-Type": "application/json"}
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
+        Failures are logged and reported as no logs, unless raise_on_error is
+        set, which lets callers tell a rejected query from an empty result.
+        """
+        logs = []
 
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.http_url}/logs/export"
-                params = {"format": "json", "query": json.dumps(request)}
+            session = self._get_session()
+            url = f"{self.http_url}/logs/export"
+            params = {"format": "json", "query": _json_dumps(request)}
 
-                logger.debug(f"HTTP GET {url} with params: {params}")
-                logger.debug(f"HTTP headers: {headers}")
+            logger.debug("HTTP GET %s with params: %s", url, params)
 
-                async with session.get(url, params=params, headers=headers) as response:
-                    response_text = await response.text()
-                    logger.debug(f"HTTP response status: {response.status}")
-                    logger.debug(f"HTTP response headers: {dict(response.headers)}")
+            async with session.get(url, params=params) as response:
+                # Parse the raw bytes, no intermediate str copy of the body
+                response_body = await response.read()
+                logger.debug("HTTP response status: %s", response.status)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"HTTP response headers: {_debug_response_headers(response.headers)}"
+                    )
                     logger.debug(
-                        f"HTTP response body (first 500 chars): {response_text[:500]}"
+                        "HTTP response body (first 500 chars): %s",
+                        response_body[:500].decode("utf-8", errors="replace"),
                     )
 
-                    if response.status == 200:
-                        try:
-                            data = json.loads(response_text)
-                            logs = data.get("logs", [])
-                            logger.debug(
-                                f"Successfully parsed JSON: {len(logs)} logs found"
+                if response.status == 200:
+                    try:
+                        data = _json_loads(response_body)
+                        logs = data.get("logs", [])
+                        logger.debug(
+                            "Successfully parsed JSON: %d logs found", len(logs)
+                        )
+                        if not logs:
+                            logger.warning(
+                                "HTTP response had no logs. Full response: %s", data
                             )
-                            if not logs:
-                                logger.warning(
-                                    f"HTTP response had no logs. Full response: {data}"
-                                )
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Failed to parse JSON response: {e}")
-                            logger.error(f"Raw response: {response_text}")
-                    else:
-                        logger.error(f"HTTP query failed with status {response.status}")
-                        logger.error(f"Error response body: {response_text}")
+                    except json.JSONDecodeError as e:
+                        # Only decode the start of the body, it can be megabytes
+                        logger.error("Failed to parse JSON response: %s", e)
+                        logger.error(
+                            "Raw response (first 500 bytes): %s",
+                            response_body[:500].decode("utf-8", errors="replace"),
+                        )
+                        if raise_on_error:
+                            raise
+                else:
+                    logger.error("HTTP query failed with status %s", response.status)
+                    logger.error(
+                        "Error response body (first 500 bytes): %s",
+                        response_body[:500].decode("utf-8", errors="replace"),
+                    )
+                    if raise_on_error:
+                        raise RuntimeError(
+                            f"HTTP query failed with status {response.status}"
+                        )
 
         except aiohttp.ClientError as e:
             # Network/connection errors
             logger.error(f"HTTP query failed - connection error: {e}")
+            if raise_on_error:
+                raise
         except asyncio.TimeoutError:
             # Request timeout
             logger.error(f"HTTP query failed - timeout")
+            if raise_on_error:
+                raise
         except json.JSONDecodeError as e:
             # Invalid JSON response
             logger.error(f"HTTP query failed - invalid JSON: {e}")
+            if raise_on_error:
+                raise
 
         return logs
 
     def _analyze_patterns(self, logs: List[Dict]) -> List[Dict]:
         """Analyze log patterns"""
+        return self._analyze_logs(logs)[0]
+
+    def _analyze_logs(self, logs: List[Dict]) -> Tuple[List[Dict], Counter]:
+        """Analyze log patterns and count levels in a single pass over logs"""
         patterns = []
+        level_counts = Counter()
 
         if not logs:
-            return patterns
+            return patterns, level_counts
 
-        # Error clustering
-        error_clusters = defaultdict(list)
+        # Running aggregates instead of the logs themselves:
+        # cluster -> {count, hosts, services}, minute bucket -> [count, errors]
+        error_clusters = defaultdict(
+            lambda: {"count": 0, "hosts": set(), "services": set()}
+        )
+        time_buckets = defaultdict(lambda: [0, 0])
         for log in logs:
-            if log.get("level") in ["ERROR", "FATAL"]:
-                msg = log.get("message", "")
+            get = log.get
+            level = get("level")
+            level_counts[level] += 1
+
+            # Error clustering
+            is_error = level in _ERROR_LEVELS
+            if is_error:
+                msg = get("message", "")
                 # Normalize for clustering
-                normalized = re.sub(r"\b\d+\b", "N", msg)
-                normalized = re.sub(r"\b[0-9a-f]{8,}\b", "HEX", normalized)[:100]
-                error_clusters[normalized].append(log)
+                normalized = _NUMBER_OR_HEX_RE.sub(_normalize_token, msg)[:100]
+                cluster = error_clusters[normalized]
+                cluster["count"] += 1
+                cluster["hosts"].add(get("host", ""))
+                cluster["services"].add(get("service", ""))
+
+            # Burst detection, bucketed per minute
+            if "timestamp" in log:
+                timestamp = log["timestamp"]
+                if (
+                    isinstance(timestamp, str)
+                    and len(timestamp) >= 16
+                    and timestamp[10] in "T "
+                    and timestamp[13] == ":"
+                ):
+                    # "YYYY-MM-DDTHH:MM..." already holds the bucket key
+                    bucket = f"{timestamp[:10]} {timestamp[11:16]}"
+                else:
+                    try:
+                        ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+                        bucket = ts.strftime("%Y-%m-%d %H:%M")
+                    except (ValueError, AttributeError) as e:
+                        # Invalid timestamp format, skip this log entry
+                        logger.debug("Invalid timestamp in log entry: %s", e)
+                        bucket = None
+                if bucket is not None:
+                    counts = time_buckets[bucket]
+                    counts[0] += 1
+                    counts[1] += is_error
 
         # Create patterns
-        for cluster_key, cluster_logs in error_clusters.items():
-            if len(cluster_logs) >= 2:
+        for cluster_key, cluster in error_clusters.items():
+            if cluster["count"] >= 2:
                 patterns.append(
                     {
                         "type": "repeated_error",
                         "pattern": cluster_key[:50],
-                        "count": len(cluster_logs),
-                        "hosts": list(set(l.get("host", "") for l in cluster_logs)),
-                        "services": list(
-                            set(l.get("service", "") for l in cluster_logs)
-                        ),
+                        "count": cluster["count"],
+                        "hosts": list(cluster["hosts"]),
+                        "services": list(cluster["services"]),
                     }
                 )
 
-        # Detect bursts
-        time_buckets = defaultdict(list)
-        for log in logs:
-            if "timestamp" in log:
-                try:
-                    ts = datetime.fromisoformat(log["timestamp"].replace("Z", "+00:00"))
-                    bucket = ts.strftime("%Y-%m-%d %H:%M")
-                    time_buckets[bucket].append(log)
-                except (ValueError, AttributeError) as e:
-                    # Invalid timestamp format, skip this log entry
-                    logger.debug(f"Invalid timestamp in log entry: {e}")
-                    continue
-
-        for bucket, bucket_logs in time_buckets.items():
-            if len(bucket_logs) > 50:
+        for bucket, (count, error_count) in time_buckets.items():
+            if count > 50:
                 patterns.append(
                     {
                         "type": "burst",
                         "time": bucket,
-                        "count": len(bucket_logs),
-                        "error_count": sum(
-                            1
-                            for l in bucket_logs
-                            if l.get("level") in ["ERROR", "FATAL"]
-                        ),
+                        "count": count,
+                        "error_count": error_count,
                     }
                 )
 
-        return patterns
+        return patterns, level_counts
 
-    def _generate_insights(self, logs: List[Dict], patterns: List[Dict]) -> Dict:
-        """Generate insights from logs and patterns"""
+    def _generate_insights(
+        self,
+        logs: List[Dict],
+        patterns: List[Dict],
+        level_counts: Optional[Counter] = None,
+    ) -> Dict:
+        """Generate insights from logs and patterns
+
+        level_counts can be passed from _analyze_logs to avoid counting again.
+        """
         insights = {"summary": "", "severity": "normal", "recommendations": []}
 
         if not logs:
@@ -901,9 +1112,11 @@ class CroitLogSearchClient:
             return insights
 
         # Calculate metrics
+        if level_counts is None:
+            level_counts = Counter(l.get("level") for l in logs)
         total = len(logs)
-        errors = sum(1 for l in logs if l.get("level") == "ERROR")
-        fatals = sum(1 for l in logs if l.get("level") == "FATAL")
+        errors = level_counts["ERROR"]
+        fatals = level_counts["FATAL"]
 
         # Determine severity
         if fatals > 0:
@@ -918,8 +1131,8 @@ class CroitLogSearchClient:
         else:
             insights["summary"] = f"Analyzed {total} logs"
 
-        # Generate recommendations
-        for pattern in patterns[:3]:
+        # Generate recommendations for the three largest patterns
+        for pattern in heapq.nlargest(3, patterns, key=lambda p: p["count"]):
             if pattern["type"] == "repeated_error":
                 insights["recommendations"].append(
                     f"Investigate repeated error on {len(pattern['hosts'])} hosts"
@@ -932,6 +1145,19 @@ class CroitLogSearchClient:
         return insights
 
 
+# systemd unit per Ceph daemon type, e.g. osd.12 -> ceph-osd@12.service. OSD
+# ids must be numeric, the other daemons are named after their host.
+_SERVICE_UNIT_TEMPLATES = {
+    "osd": "ceph-osd@{}.service",
+    "mon": "ceph-mon@{}.service",
+    "mgr": "ceph-mgr@{}.service",
+    "mds": "ceph-mds@{}.service",
+    "rgw": "ceph-radosgw@{}.service",
+}
+# Ceph daemon names in lowercased free text, e.g. "osd.12", "mon.host1"
+_CEPH_SERVICE_RE = re.compile(r"\b(?:osd|mon|mgr|mds|rgw)\.[\w\-\.]+\b")
+
+
 class CephServiceTranslator:
     """Translate Ceph service names to systemd service names"""
 
@@ -944,60 +1170,249 @@ class CephServiceTranslator:
         - mon.hostname -> ceph-mon@hostname.service
         - mgr.node1 -> ceph-mgr@node1.service
         """
-        import re
-
-        # Handle Ceph OSD services: osd.12 -> ceph-osd@12.service
-        osd_match = re.match(r"^osd\.(\d+)$", service_name)
-        if osd_match:
-            osd_id = osd_match.group(1)
-            return f"ceph-osd@{osd_id}.service"
-
-        # Handle Ceph MON services: mon.hostname -> ceph-mon@hostname.service
-        mon_match = re.match(r"^mon\.(.+)$", service_name)
-        if mon_match:
-            mon_id = mon_match.group(1)
-            return f"ceph-mon@{mon_id}.service"
-
-        # Handle Ceph MGR services: mgr.hostname -> ceph-mgr@hostname.service
-        mgr_match = re.match(r"^mgr\.(.+)$", service_name)
-        if mgr_match:
-            mgr_id = mgr_match.group(1)
-            return f"ceph-mgr@{mgr_id}.service"
-
-        # Handle Ceph MDS services: mds.hostname -> ceph-mds@hostname.service
-        mds_match = re.match(r"^mds\.(.+)$", service_name)
-        if mds_match:
-            mds_id = mds_match.group(1)
-            return f"ceph-mds@{mds_id}.service"
-
-        # Handle Ceph RGW services: rgw.hostname -> ceph-radosgw@hostname.service
-        rgw_match = re.match(r"^rgw\.(.+)$", service_name)
-        if rgw_match:
-            rgw_id = rgw_match.group(1)
-            return f"ceph-radosgw@{rgw_id}.service"
-
-        # If no translation needed, return as-is (might already be systemd format)
-        return service_name
+        daemon_type, _, daemon_id = service_name.partition(".")
+        template = _SERVICE_UNIT_TEMPLATES.get(daemon_type)
+        if (
+            template is None
+            or not daemon_id
+            or (daemon_type == "osd" and not daemon_id.isdecimal())
+        ):
+            # If no translation needed, return as-is (might already be systemd format)
+            return service_name
+        return template.format(daemon_id)
 
     @staticmethod
     def detect_ceph_services_in_text(text: str) -> List[str]:
-        """Detect Ceph service references in natural language text"""
-        import re
-
-        services = []
+        """Detect Ceph service references in natural language text
 
+        Matching is case-insensitive, the names are returned lowercased.
+        """
         # Look for patterns like "osd.12", "mon.host1", etc.
-        ceph_service_pattern = r"\b(osd|mon|mgr|mds|rgw)\.[\w\-\.]+\b"
-        matches = re.findall(ceph_service_pattern, text, re.IGNORECASE)
-
-        for match in matches:
-            full_match = re.search(
-                rf"\b{re.escape(match)}\.[\w\-\.]+\b", text, re.IGNORECASE
-            )
-            if full_match:
-                services.append(full_match.group())
+        return _CEPH_SERVICE_RE.findall(text.lower())
+
+
+# Debug templates are static configuration, built once at import; callers
+# get deep copies so they cannot change what later callers see
+_DEBUG_TEMPLATES: Dict[str, Dict] = {
+    "osd_health_check": {
+        "name": "OSD Health Check",
+        "description": "Check for OSD failures, flapping, and performance issues",
+        "query": {
+            "where": {
+                "_and": [
+                    {"_SYSTEMD_UNIT": {"_regex": "ceph-osd@.*"}},
+                    {"PRIORITY": {"_lte": 4}},
+                ]
+            }
+        },
+        "hours_back": 24,
+        "limit": 100,
+    },
+    "cluster_status_errors": {
+        "name": "Cluster Status Errors",
+        "description": "Find critical cluster-wide errors and warnings",
+        "query": {
+            "where": {
+                "_and": [
+                    {"_SYSTEMD_UNIT": {"_contains": "ceph-mon"}},
+                    {"PRIORITY": {"_lte": 3}},
+                    {"MESSAGE": {"_regex": "(error|fail|critical|emergency)"}},
+                ]
+            }
+        },
+        "hours_back": 48,
+        "limit": 50,
+    },
+    "slow_requests": {
+        "name": "Slow Request Analysis",
+        "description": "Identify slow operations and blocked requests",
+        "query": {
+            "where": {
+                "_and": [
+                    {"MESSAGE": {"_contains": "slow request"}},
+                    {"PRIORITY": {"_lte": 5}},
+                ]
+            }
+        },
+        "hours_back": 12,
+        "limit": 200,
+    },
+    "pg_issues": {
+        "name": "Placement Group Issues",
+        "description": "Find PG-related problems: inconsistent, incomplete, degraded",
+        "query": {
+            "where": {
+                "_and": [
+                    {"MESSAGE": {"_regex": "(pg|placement.?group)"}},
+                    {
+                        "MESSAGE": {
+                            "_regex": "(inconsistent|incomplete|degraded|stuck|unclean)"
+                        }
+                    },
+                    {"PRIORITY": {"_lte": 4}},
+                ]
+            }
+        },
+        "hours_back": 72,
+        "limit": 100,
+    },
+    "network_errors": {
+        "name": "Network Connectivity Issues",
+        "description": "Detect network timeouts, connection failures, and heartbeat issues",
+        "query": {
+            "where": {
+                "_and": [
+                    {
+                        "MESSAGE": {
+                            "_regex": "(network|connection|timeout|heartbeat|unreachable)"
+                        }
+                    },
+                    {"PRIORITY": {"_lte": 4}},
+                ]
+            }
+        },
+        "hours_back": 24,
+        "limit": 150,
+    },
+    "mon_election": {
+        "name": "Monitor Election Issues",
+        "description": "Check for monitor election problems and quorum issues",
+        "query": {
+            "where": {
+                "_and": [
+                    {"_SYSTEMD_UNIT": {"_contains": "ceph-mon"}},
+                    {"MESSAGE": {"_regex": "(election|quorum|leader|paxos)"}},
+                    {"PRIORITY": {"_lte": 5}},
+                ]
+            }
+        },
+        "hours_back": 24,
+        "limit": 100,
+    },
+    "storage_errors": {
+        "name": "Storage Hardware Errors",
+        "description": "Find disk errors, SMART failures, and storage subsystem issues",
+        "query": {
+            "where": {
+                "_and": [
+                    {"MESSAGE": {"_regex": "(disk|storage|smart|hardware|device)"}},
+                    {"MESSAGE": {"_regex": "(error|fail|abort|timeout)"}},
+                    {"PRIORITY": {"_lte": 4}},
+                ]
+            }
+        },
+        "hours_back": 168,  # 1 week for hardware issues
+        "limit": 100,
+    },
+    "kernel_ceph_errors": {
+        "name": "Kernel Ceph Issues",
+        "description": "Check kernel-level Ceph messages and errors",
+        "query": {
+            "where": {
+                "_and": [
+                    {"_TRANSPORT": {"_eq": "kernel"}},
+                    {"MESSAGE": {"_regex": "(ceph|rbd|rados)"}},
+                    {"PRIORITY": {"_lte": 4}},
+                ]
+            }
+        },
+        "hours_back": 48,
+        "limit": 100,
+    },
+    "rbd_mapping_issues": {
+        "name": "RBD Mapping Problems",
+        "description": "Find RBD image mapping/unmapping issues and client problems",
+        "query": {
+            "where": {
+                "_and": [
+                    {"MESSAGE": {"_contains": "rbd"}},
+                    {"MESSAGE": {"_regex": "(map|unmap|mount|unmount|client)"}},
+                    {"PRIORITY": {"_lte": 5}},
+                ]
+            }
+        },
+        "hours_back": 24,
+        "limit": 100,
+    },
+    "recent_startup": {
+        "name": "Recent Service Startups",
+        "description": "Check recent Ceph service startups and initialization",
+        "query": {
+            "where": {
+                "_and": [
+                    {"_SYSTEMD_UNIT": {"_regex": "ceph-.*"}},
+                    {"MESSAGE": {"_regex": "(start|init|boot|mount|active)"}},
+                    {"PRIORITY": {"_lte": 6}},
+                ]
+            }
+        },
+        "hours_back": 6,
+        "limit": 200,
+    },
+    "specific_osd_analysis": {
+        "name": "Specific OSD Analysis (Ceph-friendly syntax)",
+        "description": "Analyze specific OSD using natural Ceph syntax (e.g., 'osd.12')",
+        "query": {
+            "where": {
+                "_and": [
+                    {"_SYSTEMD_UNIT": {"_contains": "ceph-osd@12"}},
+                    {"PRIORITY": {"_lte": 5}},
+                ]
+            }
+        },
+        "hours_back": 48,
+        "limit": 150,
+        "user_friendly_example": "Search for 'osd.12 issues' - automatically translates to systemd service name",
+    },
+    "mon_specific_debugging": {
+        "name": "Monitor Service Debugging (Ceph-friendly syntax)",
+        "description": "Debug specific monitor using natural Ceph syntax (e.g., 'mon.node1')",
+        "query": {
+            "where": {
+                "_and": [
+                    {"_SYSTEMD_UNIT": {"_contains": "ceph-mon@node1"}},
+                    {"PRIORITY": {"_lte": 4}},
+                    {"MESSAGE": {"_regex": "(error|warn|fail|election|quorum)"}},
+                ]
+            }
+        },
+        "hours_back": 24,
+        "limit": 100,
+        "user_friendly_example": "Search for 'mon.node1 election problems' - auto-translates service names",
+    },
+    "ceph_service_translation_showcase": {
+        "name": "Ceph Service Translation Examples",
+        "description": "Showcase automatic translation of Ceph service names to systemd format",
+        "examples": {
+            "osd.12": "Translates to ceph-osd@12.service",
+            "mon.hostname": "Translates to ceph-mon@hostname.service",
+            "mgr.node1": "Translates to ceph-mgr@node1.service",
+            "mds.fs-node": "Translates to ceph-mds@fs-node.service",
+            "rgw.gateway": "Translates to ceph-radosgw@gateway.service",
+        },
+        "usage_examples": [
+            "Search: 'osd.5 slow requests' → Automatically finds ceph-osd@5.service logs",
+            "Search: 'mon.ceph01 election' → Automatically finds ceph-mon@ceph01.service logs",
+            "Search: 'mgr.primary errors' → Automatically finds ceph-mgr@primary.service logs",
+        ],
+        "query": {
+            "where": {
+                "_and": [
+                    {"_SYSTEMD_UNIT": {"_regex": "ceph-(osd|mon|mgr|mds|radosgw)@.*"}},
+                    {"PRIORITY": {"_lte": 6}},
+                ]
+            }
+        },
+        "hours_back": 12,
+        "limit": 100,
+    },
+}
 
-        return services
+# (id, lowercased name, lowercased description, template) for search_templates
+_DEBUG_TEMPLATE_INDEX = tuple(
+    (template_id, t["name"].lower(), t["description"].lower(), t)
+    for template_id, t in _DEBUG_TEMPLATES.items()
+)
 
 
 class CephDebugTemplates:
@@ -1006,259 +1421,32 @@ class CephDebugTemplates:
     @staticmethod
     def get_templates() -> Dict[str, Dict]:
         """Get all available debug templates"""
-        return {
-            "osd_health_check": {
-                "name": "OSD Health Check",
-                "description": "Check for OSD failures, flapping, and performance issues",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"_SYSTEMD_UNIT": {"_regex": "ceph-osd@.*"}},
-                            {"PRIORITY": {"_lte": 4}},
-                        ]
-                    }
-                },
-                "hours_back": 24,
-                "limit": 100,
-            },
-            "cluster_status_errors": {
-                "name": "Cluster Status Errors",
-                "description": "Find critical cluster-wide errors and warnings",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"_SYSTEMD_UNIT": {"_contains": "ceph-mon"}},
-                            {"PRIORITY": {"_lte": 3}},
-                            {"MESSAGE": {"_regex": "(error|fail|critical|emergency)"}},
-                        ]
-                    }
-                },
-                "hours_back": 48,
-                "limit": 50,
-            },
-            "slow_requests": {
-                "name": "Slow Request Analysis",
-                "description": "Identify slow operations and blocked requests",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"MESSAGE": {"_contains": "slow request"}},
-                            {"PRIORITY": {"_lte": 5}},
-                        ]
-                    }
-                },
-                "hours_back": 12,
-                "limit": 200,
-            },
-            "pg_issues": {
-                "name": "Placement Group Issues",
-                "description": "Find PG-related problems: inconsistent, incomplete, degraded",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"MESSAGE": {"_regex": "(pg|placement.?group)"}},
-                            {
-                                "MESSAGE": {
-                                    "_regex": "(inconsistent|incomplete|degraded|stuck|unclean)"
-                                }
-                            },
-                            {"PRIORITY": {"_lte": 4}},
-                        ]
-                    }
-                },
-                "hours_back": 72,
-                "limit": 100,
-            },
-            "network_errors": {
-                "name": "Network Connectivity Issues",
-                "description": "Detect network timeouts, connection failures, and heartbeat issues",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {
-                                "MESSAGE": {
-                                    "_regex": "(network|connection|timeout|heartbeat|unreachable)"
-                                }
-                            },
-                            {"PRIORITY": {"_lte": 4}},
-                        ]
-                    }
-                },
-                "hours_back": 24,
-                "limit": 150,
-            },
-            "mon_election": {
-                "name": "Monitor Election Issues",
-                "description": "Check for monitor election problems and quorum issues",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"_SYSTEMD_UNIT": {"_contains": "ceph-mon"}},
-                            {"MESSAGE": {"_regex": "(election|quorum|leader|paxos)"}},
-                            {"PRIORITY": {"_lte": 5}},
-                        ]
-                    }
-                },
-                "hours_back": 24,
-                "limit": 100,
-            },
-            "storage_errors": {
-                "name": "Storage Hardware Errors",
-                "description": "Find disk errors, SMART failures, and storage subsystem issues",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {
-                                "MESSAGE": {
-                                    "_regex": "(disk|storage|smart|hardware|device)"
-                                }
-                            },
-                            {"MESSAGE": {"_regex": "(error|fail|abort|timeout)"}},
-                            {"PRIORITY": {"_lte": 4}},
-                        ]
-                    }
-                },
-                "hours_back": 168,  # 1 week for hardware issues
-                "limit": 100,
-            },
-            "kernel_ceph_errors": {
-                "name": "Kernel Ceph Issues",
-                "description": "Check kernel-level Ceph messages and errors",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"_TRANSPORT": {"_eq": "kernel"}},
-                            {"MESSAGE": {"_regex": "(ceph|rbd|rados)"}},
-                            {"PRIORITY": {"_lte": 4}},
-                        ]
-                    }
-                },
-                "hours_back": 48,
-                "limit": 100,
-            },
-            "rbd_mapping_issues": {
-                "name": "RBD Mapping Problems",
-                "description": "Find RBD image mapping/unmapping issues and client problems",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"MESSAGE": {"_contains": "rbd"}},
-                            {"MESSAGE": {"_regex": "(map|unmap|mount|unmount|client)"}},
-                            {"PRIORITY": {"_lte": 5}},
-                        ]
-                    }
-                },
-                "hours_back": 24,
-                "limit": 100,
-            },
-            "recent_startup": {
-                "name": "Recent Service Startups",
-                "description": "Check recent Ceph service startups and initialization",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"_SYSTEMD_UNIT": {"_regex": "ceph-.*"}},
-                            {"MESSAGE": {"_regex": "(start|init|boot|mount|active)"}},
-                            {"PRIORITY": {"_lte": 6}},
-                        ]
-                    }
-                },
-                "hours_back": 6,
-                "limit": 200,
-            },
-            "specific_osd_analysis": {
-                "name": "Specific OSD Analysis (Ceph-friendly syntax)",
-                "description": "Analyze specific OSD using natural Ceph syntax (e.g., 'osd.12')",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"_SYSTEMD_UNIT": {"_contains": "ceph-osd@12"}},
-                            {"PRIORITY": {"_lte": 5}},
-                        ]
-                    }
-                },
-                "hours_back": 48,
-                "limit": 150,
-                "user_friendly_example": "Search for 'osd.12 issues' - automatically translates to systemd service name",
-            },
-            "mon_specific_debugging": {
-                "name": "Monitor Service Debugging (Ceph-friendly syntax)",
-                "description": "Debug specific monitor using natural Ceph syntax (e.g., 'mon.node1')",
-                "query": {
-                    "where": {
-                        "_and": [
-                            {"_SYSTEMD_UNIT": {"_contains": "ceph-mon@node1"}},
-                            {"PRIORITY": {"_lte": 4}},
-                            {
-                                "MESSAGE": {
-                                    "_regex": "(error|warn|fail|election|quorum)"
-                                }
-                            },
-                        ]
-                    }
-                },
-                "hours_back": 24,
-                "limit": 100,
-                "user_friendly_example": "Search for 'mon.node1 election problems' - auto-translates service names",
-            },
-            "ceph_service_translation_showcase": {
-                "name": "Ceph Service Translation Examples",
-                "description": "Showcase automatic translation of Ceph service names to systemd format",
-                "examples": {
-                    "osd.12": "Translates to ceph-osd@12.service",
-                    "mon.hostname": "Translates to ceph-mon@hostname.service",
-                    "mgr.node1": "Translates to ceph-mgr@node1.service",
-                    "mds.fs-node": "Translates to ceph-mds@fs-node.service",
-                    "rgw.gateway": "Translates to ceph-radosgw@gateway.service",
-                },
-                "usage_examples": [
-                    "Search: 'osd.5 slow requests' → Automatically finds ceph-osd@5.service logs",
-                    "Search: 'mon.ceph01 election' → Automatically finds ceph-mon@ceph01.service logs",
-                    "Search: 'mgr.primary errors' → Automatically finds ceph-mgr@primary.service logs",
-                ],
-                "query": {
-                    "where": {
-                        "_and": [
-                            {
-                                "_SYSTEMD_UNIT": {
-                                    "_regex": "ceph-(osd|mon|mgr|mds|radosgw)@.*"
-                                }
-                            },
-                            {"PRIORITY": {"_lte": 6}},
-                        ]
-                    }
-                },
-                "hours_back": 12,
-                "limit": 100,
-            },
-        }
+        return copy.deepcopy(_DEBUG_TEMPLATES)
 
     @staticmethod
     def get_template_by_scenario(scenario: str) -> Optional[Dict]:
         """Get a specific template by scenario name"""
-        templates = CephDebugTemplates.get_templates()
-        return templates.get(scenario)
+        template = _DEBUG_TEMPLATES.get(scenario)
+        return copy.deepcopy(template) if template is not None else None
 
     @staticmethod
     def list_scenarios() -> List[str]:
         """List all available debug scenarios"""
-        return list(CephDebugTemplates.get_templates().keys())
+        return list(_DEBUG_TEMPLATES)
 
     @staticmethod
     def search_templates(keyword: str) -> List[Dict]:
         """Search templates by keyword in name or description"""
-        templates = CephDebugTemplates.get_templates()
-        results = []
-
         keyword_lower = keyword.lower()
-        for template_id, template in templates.items():
-            if (
-                keyword_lower in template["name"].lower()
-                or keyword_lower in template["description"].lower()
-            ):
-                results.append({"id": template_id, "template": template})
+        return [
+            {"id": template_id, "template": copy.deepcopy(template)}
+            for template_id, name, description, template in _DEBUG_TEMPLATE_INDEX
+            if keyword_lower in name or keyword_lower in description
+        ]
+
 
-        return results
+# Journald priorities EMERG through ERR
+_CRITICAL_PRIORITIES = frozenset({0, 1, 2, 3})
 
 
 class ServerIDDetector:
@@ -1267,7 +1455,7 @@ class ServerIDDetector:
     def __init__(self, client):
         self.client = client
         self.server_cache = {}
-        self.cache_timestamp = None
+        self.cache_timestamp: Optional[float] = None  # time.monotonic()
         self.cache_ttl = 3600  # 1 hour cache
 
     async def detect_servers(self, force_refresh: bool = False) -> Dict[str, Any]:
@@ -1276,8 +1464,8 @@ class ServerIDDetector:
         # Check cache
         if (
             not force_refresh
-            and self.cache_timestamp
-            and (datetime.now() - self.cache_timestamp).seconds < self.cache_ttl
+            and self.cache_timestamp is not None
+            and time.monotonic() - self.cache_timestamp < self.cache_ttl
         ):
             return self.server_cache
 
@@ -1298,7 +1486,7 @@ class ServerIDDetector:
 
             server_info = self._analyze_server_distribution(logs)
             self.server_cache = server_info
-            self.cache_timestamp = datetime.now()
+            self.cache_timestamp = time.monotonic()
 
             return server_info
 
@@ -1313,37 +1501,40 @@ class ServerIDDetector:
 
     def _analyze_server_distribution(self, logs: List[Dict]) -> Dict[str, Any]:
         """Analyze server distribution from logs"""
-        server_counts = Counter()
-        server_services = defaultdict(set)
-        server_hostnames = {}
+        # Per-server aggregates, filled in during the single scan
+        servers = {}
 
         for log in logs:
             # Try both field names
             server_id = log.get("CROIT_SERVERID") or log.get("CROIT_SERVER_ID")
             if server_id:
-                server_counts[str(server_id)] += 1
+                server = servers.get(str(server_id))
+                if server is None:
+                    server = servers[str(server_id)] = {
+                        "log_count": 0,
+                        "services": set(),
+                        "hostname": None,
+                    }
+                server["log_count"] += 1
 
                 # Track services per server
-                unit = log.get("_SYSTEMD_UNIT", "unknown")
-                server_services[str(server_id)].add(unit)
+                server["services"].add(log.get("_SYSTEMD_UNIT", "unknown"))
 
                 # Track hostnames
-                hostname = log.get("_HOSTNAME")
-                if hostname and server_id not in server_hostnames:
-                    server_hostnames[str(server_id)] = hostname
+                if server["hostname"] is None:
+                    server["hostname"] = log.get("_HOSTNAME") or None
 
         # Generate server analysis
         total_logs = len(logs)
-        servers = {}
-
-        for server_id, count in server_counts.items():
+        for server_id, server in servers.items():
+            count = server["log_count"]
             servers[server_id] = {
                 "log_count": count,
                 "log_percentage": (
                     round((count / total_logs) * 100, 1) if total_logs > 0 else 0
                 ),
-                "services": list(server_services[server_id]),
-                "hostname": server_hostnames.get(server_id, "unknown"),
+                "services": list(server["services"]),
+                "hostname": server["hostname"] or "unknown",
                 "active": count > 10,  # Consider active if > 10 logs in 24h
             }
 
@@ -1351,8 +1542,8 @@ class ServerIDDetector:
             "servers": servers,
             "total_servers": len(servers),
             "most_active": (
-                max(server_counts.keys(), key=server_counts.get)
-                if server_counts
+                max(servers, key=lambda sid: servers[sid]["log_count"])
+                if servers
                 else None
             ),
             "detection_timestamp": datetime.now().isoformat(),
@@ -1456,6 +1647,47 @@ class ServerIDDetector:
         return "\n".join(lines)
 
 
+def _matches_where(log: Dict, where: Dict) -> bool:
+    """Evaluate a Croit where clause against one log entry
+
+    Covers the operators used by the kernel log strategies (_and, _or, _eq,
+    _lte, _contains, _regex), so logs from a combined query can be split
+    back up per strategy. This approximates the server and can diverge from
+    it: _eq and _contains compare case-sensitively as strings, _regex uses
+    Python re syntax rather than the server's RE2 dialect, and _lte only
+    matches values that parse as integers. find_kernel_logs re-queries the
+    server whenever a strategy ends up without matches.
+    """
+    for field, condition in where.items():
+        if field == "_and":
+            if not all(_matches_where(log, part) for part in condition):
+                return False
+        elif field == "_or":
+            if not any(_matches_where(log, part) for part in condition):
+                return False
+        else:
+            value = log.get(field)
+            if value is None:
+                return False
+            for op, expected in condition.items():
+                if op == "_eq":
+                    matched = str(value) == str(expected)
+                elif op == "_lte":
+                    try:
+                        matched = int(value) <= expected
+                    except (TypeError, ValueError):
+                        matched = False
+                elif op == "_contains":
+                    matched = str(expected) in str(value)
+                elif op == "_regex":
+                    matched = re.search(expected, str(value)) is not None
+                else:
+                    raise ValueError(f"Unsupported where operator: {op}")
+                if not matched:
+                    return False
+    return True
+
+
 class LogTransportAnalyzer:
     """Analyze available log transports and debug kernel log availability"""
 
@@ -1494,10 +1726,8 @@ class LogTransportAnalyzer:
 
     def _analyze_transport_distribution(self, logs: List[Dict]) -> Dict[str, Any]:
         """Analyze transport field distribution in logs"""
-        transport_counts = Counter()
-        transport_priorities = defaultdict(Counter)
-        transport_services = defaultdict(set)
-        sample_messages = defaultdict(list)
+        # Per-transport aggregates, filled in during the single scan
+        transport_details = {}
 
         for log in logs:
             # Check all possible transport field names
@@ -1508,21 +1738,39 @@ class LogTransportAnalyzer:
                 or "unknown"
             )
 
-            transport_counts[transport] += 1
+            details = transport_details.get(transport)
+            if details is None:
+                details = transport_details[transport] = {
+                    "log_count": 0,
+                    "priority_distribution": Counter(),
+                    "critical_logs": 0,
+                    "services": set(),
+                    "sample_messages": [],
+                }
+            details["log_count"] += 1
 
             # Track priority distribution per transport
             priority = log.get("PRIORITY", 6)
-            transport_priorities[transport][priority] += 1
-
-            # Track services per transport
-            service = log.get("_SYSTEMD_UNIT", log.get("SYSLOG_IDENTIFIER", "unknown"))
-            transport_services[transport].add(service)
+            details["priority_distribution"][priority] += 1
+            if priority in _CRITICAL_PRIORITIES:
+                details["critical_logs"] += 1
+
+            # Track services per transport (only the first 10 are reported)
+            services = details["services"]
+            if len(services) < 10:
+                services.add(
+                    log.get("_SYSTEMD_UNIT", log.get("SYSLOG_IDENTIFIER", "unknown"))
+                )
 
             # Collect sample messages (first 3 per transport)
-            if len(sample_messages[transport]) < 3:
+            if len(details["sample_messages"]) < 3:
                 message = log.get("MESSAGE", "")[:100]
                 if message:
-                    sample_messages[transport].append(message)
+                    details["sample_messages"].append(message)
+
+        transport_counts = Counter(
+            {transport: d["log_count"] for transport, d in transport_details.items()}
+        )
 
         # Generate analysis
         total_logs = len(logs)
@@ -1534,23 +1782,18 @@ class LogTransportAnalyzer:
         }
 
         # Detailed transport info
-        transport_details = {}
-        for transport, count in transport_counts.items():
-            priority_dist = dict(transport_priorities[transport])
-            services = list(transport_services[transport])
+        for transport, details in transport_details.items():
+            count = details["log_count"]
 
             transport_details[transport] = {
                 "log_count": count,
                 "percentage": (
                     round((count / total_logs) * 100, 1) if total_logs > 0 else 0
                 ),
-                "priority_distribution": priority_dist,
-                "services": services[:10],  # Top 10 services
-                "sample_messages": sample_messages[transport],
-                "critical_logs": priority_dist.get(0, 0)
-                + priority_dist.get(1, 0)
-                + priority_dist.get(2, 0)
-                + priority_dist.get(3, 0),
+                "priority_distribution": dict(details["priority_distribution"]),
+                "services": list(details["services"]),
+                "sample_messages": details["sample_messages"],
+                "critical_logs": details["critical_logs"],
             }
 
         analysis["transport_details"] = transport_details
@@ -1644,38 +1887,80 @@ class LogTransportAnalyzer:
             },
         ]
 
-        results = {}
-
-        for strategy in strategies:
-            try:
-                start_time, end_time = calculate_time_range(hours_back)
-                query = {
-                    "type": "query",
-                    "start": start_time,
-                    "end": end_time,
-                    "query": {**strategy["query"], "limit": limit},
-                }
+        start_time, end_time = calculate_time_range(hours_back)
 
-                logs = await self.client._execute_http_query(query)
+        def build_request(query: Dict, query_limit: int) -> Dict:
+            return {
+                "type": "query",
+                "start": start_time,
+                "end": end_time,
+                "query": {**query, "limit": query_limit},
+            }
 
-                results[strategy["name"]] = {
-                    "success": len(logs) > 0,
-                    "log_count": len(logs),
-                    "sample_messages": [
-                        log.get("MESSAGE", "")[:100] for log in logs[:3]
-                    ],
-                    "transports_found": list(
-                        set(log.get("_TRANSPORT", "unknown") for log in logs)
-                    ),
-                    "query_used": strategy["query"],
+        # Ask for all strategies in one query and split the result up
+        # locally. Only plain where clauses can be merged into an _or.
+        gathered = None
+        if all(strategy["query"].keys() == {"where"} for strategy in strategies):
+            combined_query = {
+                "where": {
+                    "_or": [strategy["query"]["where"] for strategy in strategies]
                 }
-
+            }
+            combined_limit = limit * len(strategies)
+            try:
+                combined = await self.client._execute_http_query(
+                    build_request(combined_query, combined_limit),
+                    raise_on_error=True,
+                )
             except Exception as e:
+                logger.debug("Combined kernel log query rejected: %s", e)
+            else:
+                # A full result may be crowded out by one noisy strategy
+                if len(combined) < combined_limit:
+                    gathered = [
+                        [
+                            log
+                            for log in combined
+                            if _matches_where(log, strategy["query"]["where"])
+                        ][:limit]
+                        for strategy in strategies
+                    ]
+                    if not all(gathered):
+                        gathered = None
+
+        if gathered is None:
+            # The combined query was rejected, cut off by its limit or left a
+            # strategy without hits (the local matcher may disagree with the
+            # server), run the strategies on their own, concurrently
+            gathered = await asyncio.gather(
+                *(
+                    self.client._execute_http_query(
+                        build_request(strategy["query"], limit)
+                    )
+                    for strategy in strategies
+                ),
+                return_exceptions=True,
+            )
+
+        results = {}
+        for strategy, logs in zip(strategies, gathered):
+            if isinstance(logs, Exception):
                 results[strategy["name"]] = {
                     "success": False,
-                    "error": str(e),
+                    "error": str(logs),
                     "query_used": strategy["query"],
                 }
+                continue
+
+            results[strategy["name"]] = {
+                "success": len(logs) > 0,
+                "log_count": len(logs),
+                "sample_messages": [log.get("MESSAGE", "")[:100] for log in logs[:3]],
+                "transports_found": list(
+                    set(log.get("_TRANSPORT", "unknown") for log in logs)
+                ),
+                "query_used": strategy["query"],
+            }
 
         return {
             "kernel_search_results": results,
@@ -1730,6 +2015,18 @@ class LogSummaryEngine:
             "corruption",
             "loss",
         ]
+        # One case-insensitive scan per message for all critical keywords;
+        # the lookahead also reports keywords that overlap each other
+        self._critical_re = re.compile(
+            "(?=({}))".format("|".join(map(re.escape, self.critical_keywords))),
+            re.IGNORECASE,
+        )
+        self._osd_re = re.compile("osd", re.IGNORECASE)
+        self._osd_failure_re = re.compile("failed|down|crash", re.IGNORECASE)
+        # Largest score reduction a message can earn, see _extract_critical_events
+        self._max_critical_boost = (
+            20 * len({keyword.lower() for keyword in self.critical_keywords}) + 15
+        )
         self.priority_levels = {
             0: "EMERGENCY",
             1: "ALERT",
@@ -1754,18 +2051,12 @@ class LogSummaryEngine:
 
         total_logs = len(logs)
 
-        # Priority analysis
-        priority_stats = self._analyze_priorities(logs)
-
-        # Service analysis
-        service_stats = self._analyze_services(logs)
+        # Priority, service, trend and time range analysis in one pass
+        priority_stats, service_stats, trends, time_range = self._scan_logs(logs)
 
         # Critical events (prioritized)
         critical_events = self._extract_critical_events(logs, max_details)
 
-        # Time-based trends
-        trends = self._analyze_trends(logs)
-
         # Generate summary text
         summary_text = self._generate_summary_text(
             total_logs, priority_stats, service_stats, critical_events
@@ -1784,108 +2075,157 @@ class LogSummaryEngine:
             "critical_events": critical_events,
             "trends": trends,
             "recommendations": recommendations,
-            "time_range": self._get_time_range(logs),
+            "time_range": time_range,
         }
 
-    def _analyze_priorities(self, logs: List[Dict]) -> Dict:
-        """Analyze log priority distribution"""
-        priority_counts = Counter()
+    def _scan_logs(self, logs: List[Dict]) -> Tuple[Dict, Dict, Dict, Dict]:
+        """Analyze priorities, services, trends and time range in one pass
+
+        Returns the priority breakdown, the top 10 services, the hourly
+        trends and the actual time range of the logs.
+        """
+        # Keys are collected per log and counted by Counter in C afterwards
+        priorities = []
+        services = []
+        hours = []
+        add_priority = priorities.append
+        add_service = services.append
+        trend_services = []  # Unit of each log counted in the hourly trends
+        add_hour = hours.append
+        add_trend_service = trend_services.append
+        hour_keys = {}  # Local hour label per minute since the epoch
+        start_time = end_time = None
+
         for log in logs:
-            priority = log.get("PRIORITY", 6)  # Default to INFO if missing
+            get = log.get
+            add_priority(get("PRIORITY", 6))  # Default to INFO
+            add_service(get("_SYSTEMD_UNIT", get("SYSLOG_IDENTIFIER", "unknown")))
+
+            timestamp = get("__REALTIME_TIMESTAMP")
+            if not timestamp:
+                continue
+            try:
+                # Convert microseconds to seconds
+                micros = int(timestamp)
+                seconds = micros / 1000000
+            except (ValueError, OverflowError):
+                continue
+
+            if start_time is None or seconds < start_time:
+                start_time = seconds
+            if end_time is None or seconds > end_time:
+                end_time = seconds
+
+            # Group by hour for trend analysis. UTC offsets are whole minutes,
+            # so all logs of one minute share their local hour.
+            minute = micros // 60000000
+            hour_key = hour_keys.get(minute)
+            if hour_key is None:
+                try:
+                    hour_key = datetime.fromtimestamp(minute * 60).strftime(
+                        "%Y-%m-%d %H:00"
+                    )
+                except (ValueError, OverflowError):
+                    continue
+                hour_keys[minute] = hour_key
+            add_hour(hour_key)
+            add_trend_service(get("_SYSTEMD_UNIT", "unknown"))
+
+        service_counts = Counter(services)
+        hourly_counts = Counter(hours)
+        service_totals = Counter(trend_services)
+
+        # Name the handful of distinct priority values
+        priority_counts = Counter()
+        for priority, count in Counter(priorities).items():
             priority_name = self.priority_levels.get(priority, f"LEVEL_{priority}")
-            priority_counts[priority_name] += 1
+            priority_counts[priority_name] += count
 
-        return dict(priority_counts)
+        trends = {
+            "hourly_distribution": dict(hourly_counts),
+            "peak_hours": hourly_counts.most_common(3),
+            "active_services": len(service_totals),
+            "busiest_service": (
+                service_totals.most_common(1)[0][0] if service_totals else None
+            ),
+        }
 
-    def _analyze_services(self, logs: List[Dict]) -> Dict:
-        """Analyze service/unit distribution"""
-        service_counts = Counter()
-        for log in logs:
-            unit = log.get("_SYSTEMD_UNIT", log.get("SYSLOG_IDENTIFIER", "unknown"))
-            service_counts[unit] += 1
+        time_range = {}
+        if start_time is not None:
+            time_range = {
+                "start": datetime.fromtimestamp(start_time).isoformat(),
+                "end": datetime.fromtimestamp(end_time).isoformat(),
+                "duration_hours": round((end_time - start_time) / 3600, 2),
+            }
 
-        return dict(service_counts.most_common(10))  # Top 10 services
+        return (
+            dict(priority_counts),
+            dict(service_counts.most_common(10)),  # Top 10 services
+            trends,
+            time_range,
+        )
 
     def _extract_critical_events(self, logs: List[Dict], max_events: int) -> List[Dict]:
         """Extract and prioritize critical events"""
-        critical_logs = []
+        if max_events <= 0:
+            return []
 
-        for log in logs:
+        # Keep the max_events lowest scores (lowest = most critical, ties keep
+        # log order) in a heap whose top is the least critical one kept, and
+        # only build event entries for those
+        kept = []  # (-score, -log_index)
+
+        for log_index, log in enumerate(logs):
             priority = log.get("PRIORITY", 6)
-            message = log.get("MESSAGE", "").lower()
 
             # Score criticality (lower = more critical)
             criticality_score = priority * 10  # Base on priority
 
-            # Boost score for critical keywords
-            for keyword in self.critical_keywords:
-                if keyword in message:
-                    criticality_score -= 20
+            # Skip the message scan if even the largest keyword boost could
+            # not beat the least critical event kept so far
+            if (
+                len(kept) == max_events
+                and criticality_score - self._max_critical_boost >= -kept[0][0]
+            ):
+                continue
+
+            message = log.get("MESSAGE", "")
+
+            # Boost score for each critical keyword present
+            keywords = {match.lower() for match in self._critical_re.findall(message)}
+            criticality_score -= 20 * len(keywords)
 
             # Boost score for OSD-specific issues
-            if "osd" in message and any(
-                word in message for word in ["failed", "down", "crash"]
-            ):
+            if self._osd_re.search(message) and self._osd_failure_re.search(message):
                 criticality_score -= 15
 
+            if len(kept) < max_events:
+                heapq.heappush(kept, (-criticality_score, -log_index))
+            elif criticality_score < -kept[0][0]:
+                heapq.heapreplace(kept, (-criticality_score, -log_index))
+
+        critical_logs = []
+        for criticality_score, log_index in sorted(
+            (-score, -index) for score, index in kept
+        ):
+            log = logs[log_index]
+            priority = log.get("PRIORITY", 6)
+            message = log.get("MESSAGE", "")
             critical_logs.append(
                 {
                     "log": log,
+                    "log_index": log_index,
                     "score": criticality_score,
                     "timestamp": log.get("__REALTIME_TIMESTAMP", ""),
                     "service": log.get("_SYSTEMD_UNIT", "unknown"),
                     "priority": self.priority_levels.get(priority, f"LEVEL_{priority}"),
                     "message_preview": (
-                        log.get("MESSAGE", "")[:100] + "..."
-                        if len(log.get("MESSAGE", "")) > 100
-                        else log.get("MESSAGE", "")
+                        message[:100] + "..." if len(message) > 100 else message
                     ),
                 }
             )
 
-        # Sort by criticality (lowest score = most critical)
-        critical_logs.sort(key=lambda x: x["score"])
-
-        return critical_logs[:max_events]
-
-    def _analyze_trends(self, logs: List[Dict]) -> Dict:
-        """Analyze time-based trends and patterns"""
-        if not logs:
-            return {}
-
-        # Group by hour for trend analysis
-        hourly_counts = Counter()
-        service_trends = defaultdict(Counter)
-
-        for log in logs:
-            timestamp = log.get("__REALTIME_TIMESTAMP")
-            if timestamp:
-                try:
-                    # Convert microseconds to datetime
-                    dt = datetime.fromtimestamp(int(timestamp) / 1000000)
-                    hour_key = dt.strftime("%Y-%m-%d %H:00")
-                    hourly_counts[hour_key] += 1
-
-                    service = log.get("_SYSTEMD_UNIT", "unknown")
-                    service_trends[service][hour_key] += 1
-                except (ValueError, OverflowError):
-                    continue
-
-        # Find peak hours
-        peak_hours = hourly_counts.most_common(3)
-
-        return {
-            "hourly_distribution": dict(hourly_counts),
-            "peak_hours": peak_hours,
-            "active_services": len(service_trends),
-            "busiest_service": (
-                max(
-                    service_trends.keys(), key=lambda s: sum(service_trends[s].values())
-                )
-                if service_trends
-                else None
-            ),
-        }
+        return critical_logs
 
     def _generate_summary_text(
         self,
@@ -1984,60 +2324,37 @@ class LogSummaryEngine:
 
         return recommendations
 
-    def _get_time_range(self, logs: List[Dict]) -> Dict:
-        """Calculate actual time range of logs"""
-        timestamps = []
-        for log in logs:
-            timestamp = log.get("__REALTIME_TIMESTAMP")
-            if timestamp:
-                try:
-                    timestamps.append(int(timestamp) / 1000000)
-                except (ValueError, OverflowError):
-                    continue
-
-        if not timestamps:
-            return {}
 
-        start_time = min(timestamps)
-        end_time = max(timestamps)
-
-        return {
-            "start": datetime.fromtimestamp(start_time).isoformat(),
-            "end": datetime.fromtimestamp(end_time).isoformat(),
-            "duration_hours": round((end_time - start_time) / 3600, 2),
-        }
-
-
-async def _extract_logs_from_zip(zip_data: bytes) -> List[Dict]:
-    """Extract log entries from ZIP file"""
-    import zipfile
-    import io
-    import json
+def _read_zip_logs(zip_file: BinaryIO) -> List[Dict]:
+    """Extract log entries from an open ZIP file
 
+    Members are streamed line by line and the raw bytes of each line are
+    parsed directly, so a member is never held in memory as one string.
+    Blocking, run it in an executor from async code.
+    """
     logs = []
 
     try:
-        with zipfile.ZipFile(io.BytesIO(zip_data)) as zf:
+        with zipfile.ZipFile(zip_file) as zf:
             for filename in zf.namelist():
-                logger.debug(f"Processing ZIP file: {filename}")
+                logger.debug("Processing ZIP file: %s", filename)
 
                 with zf.open(filename) as file:
-                    content = file.read().decode("utf-8")
-                    lines = content.strip().split("\n")
-
-                    for line_num, line in enumerate(lines):
+                    for line_num, line in enumerate(file):
                         if line.strip():
                             try:
-                                log_entry = json.loads(line)
+                                log_entry = _json_loads(line)
                                 logs.append(log_entry)
                             except json.JSONDecodeError as e:
                                 logger.warning(
-                                    f"Failed to parse log line {line_num}: {e}"
+                                    "Failed to parse log line %d: %s", line_num, e
                                 )
                                 # Add as raw text if JSON parsing fails
                                 logs.append(
                                     {
-                                        "raw_message": line,
+                                        "raw_message": line.rstrip(b"\r\n").decode(
+                                            "utf-8", errors="replace"
+                                        ),
                                         "parse_error": str(e),
                                         "line_number": line_num,
                                     }
@@ -2056,6 +2373,25 @@ async def _extract_logs_from_zip(zip_data: bytes) -> List[Dict]:
     return logs
 
 
+async def _download_zip_logs(response: aiohttp.ClientResponse) -> List[Dict]:
+    """Download a log export ZIP file in chunks and extract its log entries
+
+    The download is spooled (to disk once it gets large) instead of being
+    read into one bytes object. The ZIP directory sits at the end of the
+    file, so extraction starts after the last chunk, in an executor.
+    """
+    with tempfile.SpooledTemporaryFile(
+        max_size=LOG_EXPORT_SPOOL_MAX_MEMORY
+    ) as zip_file:
+        async for chunk in response.content.iter_chunked(LOG_EXPORT_CHUNK_SIZE):
+            zip_file.write(chunk)
+        logger.debug("Downloaded ZIP file: %d bytes", zip_file.tell())
+
+        zip_file.seek(0)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _read_zip_logs, zip_file)
+
+
 def _generate_log_summary(
     logs: List[Dict], original_count: int, was_truncated: bool
 ) -> Dict[str, Any]:
@@ -2089,15 +2425,24 @@ def _generate_log_summary(
         "DEBUG": 5,
     }
 
+    # Cleaned name per raw service name, there are only a few distinct ones
+    service_names = {}
+
     for log in logs:
-        level = log.get("level", "INFO").upper()
+        get = log.get
+        level = get("level", "INFO").upper()
         priority_counter[level] += 1
 
         # Extract service name
-        service = log.get("service", log.get("_SYSTEMD_UNIT", "unknown"))
+        service = get("service", get("_SYSTEMD_UNIT", "unknown"))
         if service:
             # Clean service name
-            service = service.replace("ceph-", "").split("@")[0]
+            cleaned = service_names.get(service)
+            if cleaned is None:
+                cleaned = service_names[service] = service.replace("ceph-", "").split(
+                    "@"
+                )[0]
+            service = cleaned
             service_counter[service] += 1
 
         # Track critical events
@@ -2106,15 +2451,15 @@ def _generate_log_summary(
             critical_events.append(
                 {
                     "priority": level,
-                    "timestamp": log.get("timestamp", log.get("_time", "unknown")),
+                    "timestamp": get("timestamp", get("_time", "unknown")),
                     "service": service,
-                    "message_preview": log.get("message", "")[:100],
+                    "message_preview": get("message", "")[:100],
                     "score": priority_score,
                 }
             )
 
-    # Sort critical events by severity
-    critical_events.sort(key=lambda x: x["score"])
+    # Most severe critical events first, only the top 10 are reported
+    critical_events = heapq.nsmallest(10, critical_events, key=lambda x: x["score"])
 
     # Build summary text
     total_displayed = len(logs)
@@ -2166,12 +2511,39 @@ def _generate_log_summary(
     }
 
 
+# Shared session of the Croit export requests, keep-alive connections are
+# reused across searches and for the ZIP download. Created lazily on first
+# use and closed by close_export_session() when the server stops; auth
+# headers are passed per request.
+_export_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_export_session() -> aiohttp.ClientSession:
+    """Return the shared Croit export session, creating it on first use"""
+    global _export_session
+    if _export_session is None or _export_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+        )
+        _export_session = aiohttp.ClientSession(connector=connector)
+    return _export_session
+
+
+async def close_export_session() -> None:
+    """Close the shared Croit export session"""
+    global _export_session
+    if _export_session is not None and not _export_session.closed:
+        await _export_session.close()
+    _export_session = None
+
+
 async def _execute_croit_http_export(
     host: str, port: int, api_token: str, use_ssl: bool, query: Dict
 ) -> Dict:
     """Execute Croit log query via HTTP /api/logs/export endpoint"""
-    import aiohttp
-
     # Build HTTP URL
     http_protocol = "https" if use_ssl else "http"
     url = f"{http_protocol}://{host}:{port}/api/logs/export"
@@ -2183,88 +2555,83 @@ async def _execute_croit_http_export(
 
     params = {
         "format": "RAW",  # Use RAW format as discovered
-        "query": json.dumps(query),
+        "query": _json_dumps(query),
     }
 
-    logger.debug(f"HTTP GET {url}")
-    logger.debug(f"Params: {params}")
-    logger.debug(f"Headers: {headers}")
+    logger.debug("HTTP GET %s", url)
+    logger.debug("Params: %s", params)
+    logger.debug("Headers: %s", headers)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                logger.debug(f"HTTP response status: {response.status}")
-                logger.debug(f"HTTP response headers: {dict(response.headers)}")
-
-                if response.status == 200:
-                    response_json = await response.json()
-                    logger.debug(f"HTTP response JSON: {response_json}")
-
-                    # The response contains a download URL to a ZIP file
-                    download_url = response_json.get("url")
-                    if download_url:
-                        logger.debug(f"Downloading logs from: {download_url}")
-
-                        # Download and extract the ZIP file
-                        async with session.get(
-                            download_url,
-                            headers={"Authorization": f"Bearer {api_token}"},
-                        ) as zip_response:
-                            if zip_response.status == 200:
-                                zip_data = await zip_response.read()
-                                logger.debug(
-                                    f"Downloaded ZIP file: {len(zip_data)} bytes"
-                                )
-
-                                # Extract logs from ZIP
-                                logs = await _extract_logs_from_zip(zip_data)
-                                logger.debug(
-                                    f"Extracted {len(logs)} log entries from ZIP"
-                                )
+        session = _get_export_session()
+        async with session.get(url, params=params, headers=headers) as response:
+            logger.debug("HTTP response status: %s", response.status)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"HTTP response headers: {_debug_response_headers(response.headers)}"
+                )
 
-                                return {
-                                    "logs": logs,
-                                    "control_messages": [
-                                        {
-                                            "type": "success",
-                                            "message": f"Downloaded {len(logs)} logs",
-                                        }
-                                    ],
-                                    "download_info": response_json,
-                                }
-                            else:
-                                logger.error(
-                                    f"Failed to download logs: {zip_response.status}"
-                                )
-                                return {
-                                    "logs": [],
-                                    "control_messages": [
-                                        {
-                                            "type": "error",
-                                            "message": f"Download failed: {zip_response.status}",
-                                        }
-                                    ],
-                                }
-                    else:
-                        logger.error("No download URL in response")
-                        return {
-                            "logs": [],
-                            "control_messages": [
-                                {"type": "error", "message": "No download URL"}
-                            ],
-                        }
+            if response.status == 200:
+                response_json = _json_loads(await response.read())
+                logger.debug("HTTP response JSON: %s", response_json)
+
+                # The response contains a download URL to a ZIP file
+                download_url = response_json.get("url")
+                if download_url:
+                    logger.debug("Downloading logs from: %s", download_url)
+
+                    # Download and extract the ZIP file
+                    async with session.get(
+                        download_url,
+                        headers={"Authorization": f"Bearer {api_token}"},
+                    ) as zip_response:
+                        if zip_response.status == 200:
+                            logs = await _download_zip_logs(zip_response)
+                            logger.debug("Extracted %d log entries from ZIP", len(logs))
+
+                            return {
+                                "logs": logs,
+                                "control_messages": [
+                                    {
+                                        "type": "success",
+                                        "message": f"Downloaded {len(logs)} logs",
+                                    }
+                                ],
+                                "download_info": response_json,
+                            }
+                        else:
+                            logger.error(
+                                f"Failed to download logs: {zip_response.status}"
+                            )
+                            return {
+                                "logs": [],
+                                "control_messages": [
+                                    {
+                                        "type": "error",
+                                        "message": f"Download failed: {zip_response.status}",
+                                    }
+                                ],
+                            }
                 else:
-                    error_text = await response.text()
-                    logger.error(f"HTTP query failed: {response.status} - {error_text}")
+                    logger.error("No download URL in response")
                     return {
                         "logs": [],
                         "control_messages": [
-                            {
-                                "type": "error",
-                                "message": f"HTTP {response.status}: {error_text}",
-                            }
+                            {"type": "error", "message": "No download URL"}
                         ],
                     }
+            else:
+                error_text = await response.text()
+                logger.error(f"HTTP query failed: {response.status} - {error_text}")
+                return {
+                    "logs": [],
+                    "control_messages": [
+                        {
+                            "type": "error",
+                            "message": f"HTTP {response.status}: {error_text}",
+                        }
+                    ],
+                }
 
     except aiohttp.ClientError as e:
         # Network/connection errors
@@ -2293,6 +2660,41 @@ async def _execute_croit_http_export(
         }
 
 
+# Fixed control messages of the Croit log WebSocket
+_WEBSOCKET_CONTROL_MESSAGES = {
+    "clear": {"type": "clear", "message": "Log display cleared"},
+    "empty": {"type": "empty", "message": "No logs found for current query"},
+    "too_wide": {
+        "type": "too_wide",
+        "message": "Query too broad (>1M logs), please add more filters",
+    },
+}
+
+
+def _handle_hits_message(payload: str, control_messages: List[Dict]) -> None:
+    """Record the hit counts sent in a 'hits:' WebSocket message"""
+    try:
+        hits_data = _json_loads(payload.strip())
+        control_messages.append({"type": "hits", "data": hits_data})
+        logger.debug("Received hits data: %s", hits_data)
+    except json.JSONDecodeError:
+        logger.warning("Failed to parse hits data: hits:%s", payload)
+
+
+def _handle_error_message(payload: str, control_messages: List[Dict]) -> None:
+    """Record the VictoriaLogs error sent in an 'error:' WebSocket message"""
+    error_msg = payload.strip()
+    control_messages.append({"type": "error", "message": error_msg})
+    logger.error(f"VictoriaLogs error: {error_msg}")
+
+
+# Prefixed control messages of the Croit log WebSocket and their handlers
+_WEBSOCKET_PREFIX_HANDLERS = (
+    ("hits:", _handle_hits_message),
+    ("error:", _handle_error_message),
+)
+
+
 async def _execute_croit_websocket(
     host: str, port: int, api_token: str, use_ssl: bool, query: Dict
 ) -> List[Dict]:
@@ -2305,7 +2707,7 @@ async def _execute_croit_websocket(
     ws_protocol = "wss" if use_ssl else "ws"
     if api_token:
         ws_url = f"{ws_protocol}://{host}:{port}/api/logs?token={api_token}"
-        logger.debug(f"Using query param authentication")
+        logger.debug("Using query param authentication")
     else:
         ws_url = f"{ws_protocol}://{host}:{port}/api/logs"
         logger.warning("No API token provided for WebSocket authentication")
@@ -2313,85 +2715,62 @@ async def _execute_croit_websocket(
     logs = []
     control_messages = []
 
-    logger.debug(f"Attempting WebSocket connection to: {ws_url}")
+    logger.debug("Attempting WebSocket connection to: %s", ws_url)
 
     try:
         async with websockets.connect(ws_url, ping_interval=20) as websocket:
-            logger.debug(f"WebSocket connection established successfully")
+            logger.debug("WebSocket connection established successfully")
 
             # Send Croit JSON query directly (auth via URL params)
-            query_json = json.dumps(query, indent=2)
-            logger.debug(f"Sending WebSocket query: {query_json}")
+            query_json = _json_dumps(query)
+            logger.debug("Sending WebSocket query: %s", query_json)
             await websocket.send(query_json)
             logger.debug("Query sent successfully")
 
-            # Collect responses with longer timeout for query param auth
-            start_time = asyncio.get_event_loop().time()
-            while (
-                asyncio.get_event_loop().time() - start_time
-            ) < 45:  # Increased timeout
-                try:
-                    response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    if response:
-                        logger.debug(f"WebSocket response: {response[:200]}...")
+            # Checked once, not for every message of the stream
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-                        # Handle control messages
-                        if response == "clear":
-                            control_messages.append(
-                                {"type": "clear", "message": "Log display cleared"}
-                            )
-                            logger.debug("Received 'clear' control message")
-                        elif response == "empty":
-                            control_messages.append(
-                                {
-                                    "type": "empty",
-                                    "message": "No logs found for current query",
-                                }
-                            )
-                            logger.debug(
-                                "Received 'empty' control message - no logs found"
-                            )
-                        elif response == "too_wide":
-                            control_messages.append(
-                                {
-                                    "type": "too_wide",
-                                    "message": "Query too broad (>1M logs), please add more filters",
-                                }
-                            )
-                            logger.debug("Received 'too_wide' control message")
-                        elif response.startswith("hits:"):
-                            try:
-                                hits_data = (
-                                    json.loads(response[5:].strip())
-                                    if response[5:].strip() != "null"
-                                    else None
-                                )
-                                control_messages.append(
-                                    {"type": "hits", "data": hits_data}
-                                )
-                                logger.debug(f"Received hits data: {hits_data}")
-                            except json.JSONDecodeError:
-                                logger.warning(f"Failed to parse hits data: {response}")
-                        elif response.startswith("error:"):
-                            error_msg = response[6:].strip()
-                            control_messages.append(
-                                {"type": "error", "message": error_msg}
+            # Collect responses until the stream goes idle, closes or hits the
+            # overall deadline (longer for query param auth); one timer is
+            # pushed forward per message instead of a wait_for() per recv()
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + CROIT_WEBSOCKET_TIMEOUT_SECONDS
+            try:
+                async with asyncio.timeout_at(
+                    loop.time() + WEBSOCKET_MESSAGE_TIMEOUT_SECONDS
+                ) as idle_timeout:
+                    async for response in websocket:
+                        idle_timeout.reschedule(
+                            min(
+                                loop.time() + WEBSOCKET_MESSAGE_TIMEOUT_SECONDS,
+                                deadline,
                             )
-                            logger.error(f"VictoriaLogs error: {error_msg}")
+                        )
+                        if not response:
+                            continue
+                        if debug_enabled:
+                            logger.debug("WebSocket response: %.200s...", response)
+
+                        # Handle control messages
+                        control = _WEBSOCKET_CONTROL_MESSAGES.get(response)
+                        if control is not None:
+                            control_messages.append(dict(control))
+                            logger.debug("Received '%s' control message", response)
+                            continue
+                        for prefix, handler in _WEBSOCKET_PREFIX_HANDLERS:
+                            if response.startswith(prefix):
+                                handler(response[len(prefix) :], control_messages)
+                                break
                         else:
                             # Regular log entry
                             try:
-                                log_entry = json.loads(response)
-                                logs.append(log_entry)
-                                logger.debug(
-                                    f"Added log entry {len(logs)}: {log_entry.get('timestamp', 'no-timestamp')}"
-                                )
+                                logs.append(_json_loads(response))
                             except json.JSONDecodeError:
-                                logger.warning(f"Non-JSON response: {response[:100]}")
-                except asyncio.TimeoutError:
-                    break
-                except websockets.exceptions.ConnectionClosed:
-                    break
+                                logger.warning("Non-JSON response: %.100s", response)
+            except TimeoutError:
+                pass
+            except websockets.exceptions.ConnectionClosed:
+                pass
 
     except websockets.exceptions.WebSocketException as e:
         # WebSocket protocol errors
@@ -2407,7 +2786,9 @@ async def _execute_croit_websocket(
         raise
 
     logger.debug(
-        f"WebSocket query completed: {len(logs)} logs, {len(control_messages)} control messages"
+        "WebSocket query completed: %d logs, %d control messages",
+        len(logs),
+        len(control_messages),
     )
     return {"logs": logs, "control_messages": control_messages}
 
@@ -2460,7 +2841,7 @@ async def handle_log_search(
     }
 
     # Execute query via HTTP (not WebSocket!)
-    logger.debug(f"Executing HTTP query to {host}:{port}")
+    logger.debug("Executing HTTP query to %s:%s", host, port)
     response = await _execute_croit_http_export(
         host, port, api_token, use_ssl, croit_query
     )
@@ -2468,11 +2849,14 @@ async def handle_log_search(
     control_messages = response.get("control_messages", [])
 
     logger.debug(
-        f"HTTP response summary: {len(logs)} logs, {len(control_messages)} control messages"
+        "HTTP response summary: %d logs, %d control messages",
+        len(logs),
+        len(control_messages),
     )
-    if control_messages:
+    if control_messages and logger.isEnabledFor(logging.DEBUG):
         logger.debug(
-            f"Control messages received: {[msg.get('type', 'unknown') for msg in control_messages]}"
+            "Control messages received: %s",
+            [msg.get("type", "unknown") for msg in control_messages],
         )
 
     # Calculate actual hours searched
@@ -2500,8 +2884,10 @@ async def handle_log_search(
             level = log_entry.get("level", "INFO").upper()
             return priority_map.get(level, 999)
 
-        sorted_logs = sorted(logs, key=get_priority)
-        optimized_logs = sorted_logs[:MAX_LOG_ENTRIES_IN_RESPONSE]
+        # Stable like sorted(), so logs of one severity keep their order
+        optimized_logs = heapq.nsmallest(
+            MAX_LOG_ENTRIES_IN_RESPONSE, logs, key=get_priority
+        )
         was_truncated = True
         truncation_reason = (
             f"Truncated from {original_count} to {MAX_LOG_ENTRIES_IN_RESPONSE} logs "
@@ -2589,8 +2975,8 @@ async def handle_log_check(
     if not conditions:
         return {"code": 400, "error": "Conditions are required"}
 
+    client = CroitLogSearchClient(host, port, api_token, use_ssl)
     try:
-        client = CroitLogSearchClient(host, port, api_token, use_ssl)
         alerts = []
         checks = []
 
@@ -2653,6 +3039,8 @@ async def handle_log_check(
         # Unexpected errors
         logger.error(f"Log check failed - unexpected error: {type(e).__name__}: {e}")
         return {"code": 500, "error": str(e)}
+    finally:
+        await client.close()
 
 
 # Keep for backwards compatibility but mark as deprecated
@@ -18,7 +18,7 @@ from functools import lru_cache
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Cache entry with TTL support."""
 
@@ -78,8 +78,11 @@ def calculate_time_range(hours_back: float = 1.0) -> Tuple[int, int]:
         >>> (end - start) == 1800  # 30 minutes = 1800 seconds
         True
     """
-    end_time = int(datetime.now().timestamp())
-    start_time = int((datetime.now() - timedelta(hours=hours_back)).timestamp())
+    # Read the clock once so the window is exactly hours_back long, and
+    # subtract in epoch seconds so DST changes do not stretch or shrink it
+    now = datetime.now().timestamp()
+    end_time = int(now)
+    start_time = int(now - timedelta(hours=hours_back).total_seconds())
     return start_time, end_time
 
 